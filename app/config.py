@@ -1,20 +1,66 @@
+import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not available, fall back to pure-Python
+    from yaml import SafeLoader as _Loader
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize config data as indented JSON"""
+    if ORJSON_AVAILABLE:
+        # YAML-migrated configs may have int/bool keys; json.dumps stringifies those
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON config data"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_MISS = object()
+
+# Snapshot of frequently read settings, rebuilt in place by Config.reload()
+CONFIG = SimpleNamespace()
+
 
 class Config:
-    """Application configuration loaded from config.yaml"""
+    """Application configuration loaded from config.json"""
 
     _config: Optional[Dict[str, Any]] = None
-    _config_path = Path(__file__).parent / "config.yaml"
+    _loaded = False
+    _config_path = Path(__file__).parent / "config.json"
+    # Pre-JSON config location, migrated on first load
+    _legacy_config_path = Path(__file__).parent / "config.yaml"
+    _yaml_load = staticmethod(yaml.load)
+    # Resolved dotted-key lookups; cleared whenever the config changes
+    _flat_cache: Dict[str, Any] = {}
+    # Dotted keys pre-split into path tuples; keys never change meaning
+    _path_cache: Dict[str, Tuple[str, ...]] = {}
 
     @classmethod
     def load(cls):
-        """Load configuration from config.yaml"""
-        if not cls._config_path.exists():
+        """Load configuration from config.json"""
+        cls._flat_cache.clear()
+        if not cls._config_path.exists() and cls._legacy_config_path.exists():
+            cls._migrate_legacy_config()
+        elif not cls._config_path.exists():
             # Create default config if it doesn't exist
             cls._config = {
                 "initialized": False,
@@ -30,45 +76,95 @@ class Config:
             }
             cls.save()
         else:
-            with open(cls._config_path, "r") as f:
-                cls._config = yaml.safe_load(f) or {}
+            cls._config = _json_loads(cls._config_path.read_bytes()) or {}
+        cls._loaded = True
+        cls.reload()
+
+    @classmethod
+    def _migrate_legacy_config(cls):
+        """Convert an existing config.yaml to config.json, keeping it as config.yaml.bak"""
+        with open(cls._legacy_config_path, "r") as f:
+            cls._config = cls._yaml_load(f, Loader=_Loader) or {}
+        cls.save()
+        os.replace(
+            cls._legacy_config_path,
+            cls._legacy_config_path.with_name("config.yaml.bak"),
+        )
 
     @classmethod
     def save(cls):
-        """Save configuration to config.yaml"""
-        with open(cls._config_path, "w") as f:
-            yaml.dump(cls._config, f, default_flow_style=False, sort_keys=False)
+        """Save configuration to config.json"""
+        # Write a sibling file and swap it in so readers never see a partial file
+        tmp_path = cls._config_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_json_dumps(cls._config))
+        os.replace(tmp_path, cls._config_path)
 
     @classmethod
     def get(cls, key: str, default=None):
         """Get a configuration value"""
-        if cls._config is None:
+        value = cls._flat_cache.get(key, _MISS)
+        if value is _MISS:
+            value = cls._resolve(key)
+            cls._flat_cache[key] = value
+        return default if value is None else value
+
+    @classmethod
+    def _resolve(cls, key: str):
+        """Walk the config dict for a dotted key, returning None if absent"""
+        if not cls._loaded:
             cls.load()
 
-        keys = key.split(".")
         value = cls._config
-        for k in keys:
+        for k in cls._path(key):
             if isinstance(value, dict):
                 value = value.get(k)
             else:
-                return default
+                return None
             if value is None:
-                return default
+                return None
         return value
 
+    @classmethod
+    def _path(cls, key: str) -> Tuple[str, ...]:
+        """Split a dotted key once and reuse the tuple on later calls"""
+        path = cls._path_cache.get(key)
+        if path is None:
+            path = cls._path_cache[key] = tuple(key.split("."))
+        return path
+
     @classmethod
     def set(cls, key: str, value):
         """Set a configuration value"""
-        if cls._config is None:
+        if not cls._loaded:
             cls.load()
 
-        keys = key.split(".")
+        *parents, last = cls._path(key)
         config = cls._config
-        for k in keys[:-1]:
+        for k in parents:
             if k not in config:
                 config[k] = {}
             config = config[k]
-        config[keys[-1]] = value
+        config[last] = value
+        cls._flat_cache.clear()
+        cls.reload()
+
+    @classmethod
+    def reload(cls):
+        """Rebuild the CONFIG snapshot from the current configuration"""
+        host = cls.ARANGODB_HOST()
+        port = cls.ARANGODB_PORT()
+        CONFIG.__dict__.update(
+            app_name=cls.APP_NAME(),
+            debug=cls.DEBUG(),
+            arango_host=host,
+            arango_port=port,
+            arango_url=f"http://{host}:{port}",
+            arango_username=cls.ARANGODB_USERNAME(),
+            arango_password=cls.ARANGODB_PASSWORD(),
+            arango_database=cls.ARANGODB_DATABASE(),
+            db_pool_size=cls.DB_POOL_SIZE(),
+            secret_key=cls.SECRET_KEY(),
+        )
 
     @classmethod
     def is_initialized(cls) -> bool:
@@ -76,8 +172,9 @@ class Config:
         return cls.get("initialized", False)
 
     @classmethod
-    def initialize(cls, data: Dict[str, Any]):
+    def initialize(cls, data: Dict[str, Any], autosave: bool = True):
         """Initialize the application with configuration data"""
+        cls._flat_cache.clear()
         cls._config = {
             "initialized": True,
             "app": {
@@ -94,7 +191,10 @@ class Config:
             "upload": {},
             "security": {"secret_key": data.get("secret_key", os.urandom(32).hex())},
         }
-        cls.save()
+        cls._loaded = True
+        cls.reload()
+        if autosave:
+            cls.save()
 
     # Configuration accessor methods (not properties!)
     @classmethod
@@ -132,6 +232,14 @@ class Config:
         """Get ArangoDB database name"""
         return cls.get("database.database", "switch_db")
 
+    @classmethod
+    def DB_POOL_SIZE(cls) -> int:
+        """Get the ArangoDB HTTP connection pool size (default 2x CPUs, 32 to 50)"""
+        # Requests wait on ArangoDB rather than the CPU, so small hosts still need
+        # enough sockets; the cap bounds per-process memory on large hosts
+        default = min(50, max(32, 2 * (os.cpu_count() or 1)))
+        return int(cls.get("database.pool_size", default))
+
     @classmethod
     def SECRET_KEY(cls) -> str:
         """Get secret key for sessions"""
@@ -141,12 +249,14 @@ class Config:
 
     @classmethod
     def get_arangodb_url(cls) -> str:
-        """Get ArangoDB connection URL"""
-        host = cls.ARANGODB_HOST()
-        port = cls.ARANGODB_PORT()
-        return f"http://{host}:{port}"
+        """Get ArangoDB connection URL (built by reload())"""
+        return CONFIG.arango_url
 
     @classmethod
     def UPLOAD_ENDPOINT(cls) -> str:
         """Get upload endpoint URL - now returns empty string to use relative URLs"""
         return ""
+
+
+# Read the config file and build the CONFIG snapshot once at import
+Config.load()
@@ -1,21 +1,309 @@
+import asyncio
 import logging
 import os
 import shutil
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
+from aiohttp import TCPConnector
 from arangoasync import ArangoClient
 from arangoasync.auth import Auth
 from arangoasync.collection import StandardCollection
+from arangoasync.cursor import Cursor
 from arangoasync.database import StandardDatabase
-
-from app.config import Config
+from arangoasync.errno import DUPLICATE_NAME, QUERY_NOT_ELIGIBLE_FOR_PLAN_CACHING
+from arangoasync.exceptions import (
+    AQLCacheConfigureError,
+    AQLCachePropertiesError,
+    AQLQueryExecuteError,
+    CollectionCreateError,
+    DatabaseCreateError,
+    DeserializationError,
+    DocumentGetError,
+    DocumentParseError,
+    IndexCreateError,
+    SerializationError,
+)
+from arangoasync.http import AioHTTPClient
+from arangoasync.serialization import Deserializer, Serializer
+
+from app.config import CONFIG
+from app.utils.time_utils import now_iso
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 # Constants
 BYTES_PER_GB = 1024**3  # 1073741824 bytes per GB
 
+# In-process user cache used by the auth lookups
+USER_CACHE_TTL = 30  # seconds
+USER_CACHE_SIZE = 1024
+
+# Active API keys by hash, checked on every authenticated API request
+API_KEY_CACHE_TTL = 30  # seconds
+API_KEY_CACHE_SIZE = 4096
+
+# The directory list is read on every file download to validate paths
+DIRECTORY_CACHE_TTL = 30  # seconds
+
+# Download history and API usage logs are buffered in process and written in batches
+WRITE_BUFFER_FLUSH_SIZE = 100
+WRITE_BUFFER_FLUSH_INTERVAL = 1.0  # seconds
+# Records from failed flushes are retried; beyond this many the oldest are dropped
+WRITE_BUFFER_MAX_SIZE = 10000
+
+# Site-wide aggregates (dashboard, admin stats pages) are recomputed at most this often
+STATS_CACHE_TTL = 30  # seconds
+
+# Idle ping so pooled sockets stay open (the connector drops them after 60s)
+KEEPALIVE_INTERVAL = 20  # seconds
+
+# Maximum documents sent per bulk insert request
+BULK_INSERT_BATCH_SIZE = 5000
+
+# Cursor batch size for full-collection reads (driver default is 1000)
+LARGE_BATCH_SIZE = 10000
+
+# Entry listing projected to the API shape server-side (_key is exposed as id)
+ENTRY_PROJECTION = """{
+    id: doc._key,
+    name: doc.name,
+    source: doc.source,
+    type: doc.type,
+    file_type: doc.file_type,
+    size: doc.size,
+    created_at: doc.created_at,
+    created_by: NOT_NULL(doc.created_by, ""),
+    metadata: NOT_NULL(doc.metadata, {})
+}"""
+
+ENTRY_LIST_QUERY = f"""
+FOR doc IN entries
+SORT doc.size DESC
+RETURN {ENTRY_PROJECTION}
+"""
+
+ENTRY_PAGE_QUERY = f"""
+FOR doc IN entries
+SORT doc.size DESC
+LIMIT @offset, @limit
+RETURN {ENTRY_PROJECTION}
+"""
+
+# Multi-get by key in one round trip; missing keys are skipped
+USER_MANY_QUERY = """
+FOR id IN @ids
+LET doc = DOCUMENT("users", id)
+FILTER doc != null
+RETURN doc
+"""
+
+# Existence probes return a single bool without shipping the document
+USER_EXISTS_QUERY = """
+RETURN LENGTH(
+    FOR doc IN users FILTER doc.username == @username LIMIT 1 RETURN 1
+) > 0
+"""
+
+ENTRY_EXISTS_QUERY = """
+RETURN LENGTH(
+    FOR doc IN entries FILTER doc.source == @source LIMIT 1 RETURN 1
+) > 0
+"""
+
+ENTRY_NAME_EXISTS_QUERY = """
+RETURN LENGTH(
+    FOR doc IN entries FILTER doc.name == @name LIMIT 1 RETURN 1
+) > 0
+"""
+
+USER_LIST_QUERY = "FOR doc IN users SORT doc.created_at DESC RETURN doc"
+
+# Same listing with credentials stripped server-side so they never cross the wire
+PUBLIC_USER_LIST_QUERY = """
+FOR doc IN users
+SORT doc.created_at DESC
+RETURN UNSET(doc, "password_hash", "totp_secret")
+"""
+
+DIRECTORY_LIST_QUERY = "FOR doc IN directories SORT doc.added_at DESC RETURN doc"
+
+DOWNLOAD_HISTORY_QUERY = """
+FOR doc IN download_history
+FILTER doc.user_id == @user_id
+SORT doc.downloaded_at DESC
+LIMIT @limit
+RETURN {
+    id: doc._key,
+    entry_id: doc.entry_id,
+    entry_name: doc.entry_name,
+    downloaded_at: doc.downloaded_at
+}
+"""
+
+# Batched last-used update; keys deleted since they were queued are skipped
+API_KEY_LAST_USED_QUERY = """
+FOR u IN @updates
+UPDATE u.key WITH { last_used_at: u.last_used_at } IN api_keys
+OPTIONS { ignoreErrors: true }
+"""
+
+# Collections used by the app; each is bound to Database.<name>_collection
+COLLECTIONS = (
+    "entries",
+    "users",
+    "directories",
+    "download_history",
+    "requests",
+    "api_keys",
+    "api_usage",
+    "audit_logs",
+    "activity_logs",
+    "upload_statistics",
+    "reports",
+    "comments",
+    "likes",
+    "comment_likes",
+)
+
+# Persistent indexes backing hot FILTER/SORT predicates: (collection, fields, unique)
+INDEXES = (
+    ("users", ["username"], True),
+    ("directories", ["path"], True),
+    ("directories", ["added_at"], False),
+    ("entries", ["source"], False),
+    ("entries", ["created_at"], False),
+    ("entries", ["size"], False),
+    ("entries", ["name"], False),
+    ("entries", ["corrupt"], False),
+    ("requests", ["user_id"], False),
+    ("requests", ["status"], False),
+    ("download_history", ["user_id", "downloaded_at"], False),
+    ("download_history", ["entry_id"], False),
+    ("upload_statistics", ["user_id"], False),
+    ("api_keys", ["key_hash"], True),
+    ("api_keys", ["user_id"], False),
+    ("reports", ["entry_id", "status"], False),
+    ("reports", ["status"], False),
+    ("likes", ["entry_id", "vote_type"], False),
+    ("comments", ["entry_id"], False),
+    ("audit_logs", ["timestamp"], False),
+    ("audit_logs", ["action", "timestamp"], False),
+    ("audit_logs", ["actor_id", "timestamp"], False),
+    ("audit_logs", ["target_id", "timestamp"], False),
+    ("activity_logs", ["timestamp"], False),
+    ("activity_logs", ["event_type", "timestamp"], False),
+    ("activity_logs", ["user_id", "timestamp"], False),
+    ("api_usage", ["api_key_id", "timestamp"], False),
+    ("api_usage", ["user_id", "timestamp"], False),
+)
+
+
+class OrjsonSerializer(Serializer[Any]):
+    """Request body serializer backed by orjson"""
+
+    def dumps(self, data: Any) -> str:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError as e:
+            raise SerializationError("Failed to serialize data to JSON.") from e
+
+
+class OrjsonDeserializer(Deserializer[Any, Any]):
+    """Response body deserializer backed by orjson"""
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            raise DeserializationError("Failed to deserialize data from JSON.") from e
+
+    def loads_many(self, data: bytes) -> Any:
+        return self.loads(data)
+
+
+# Shared clients keyed by hosts URL, so every Database reuses one HTTP pool
+_clients: Dict[str, ArangoClient] = {}
+
+
+def _get_client(hosts: str) -> ArangoClient:
+    """Return the process-wide ArangoClient for these hosts, creating it once"""
+    client = _clients.get(hosts)
+    if client is None:
+        # One pool shared by every coroutine using db, sized by
+        # Config.DB_POOL_SIZE(); closed sockets are reaped
+        connector = TCPConnector(
+            limit=CONFIG.db_pool_size,
+            limit_per_host=CONFIG.db_pool_size,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        kwargs: Dict[str, Any] = {"http_client": AioHTTPClient(connector=connector)}
+        if ORJSON_AVAILABLE:
+            kwargs["serializer"] = OrjsonSerializer()
+            kwargs["deserializer"] = OrjsonDeserializer()
+        client = _clients[hosts] = ArangoClient(hosts=hosts, **kwargs)
+    return client
+
+
+async def close_clients():
+    """Close every shared ArangoClient; call once at application shutdown"""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.error("Error closing ArangoDB client: %s", e)
+
+
+def _requeue(
+    batch: List[Dict[str, Any]], buffer: List[Dict[str, Any]], what: str
+) -> List[Dict[str, Any]]:
+    """Put a failed batch back ahead of newer records, capped at WRITE_BUFFER_MAX_SIZE"""
+    merged = batch + buffer
+    dropped = len(merged) - WRITE_BUFFER_MAX_SIZE
+    if dropped > 0:
+        logger.warning("Dropping %s buffered %s records", dropped, what)
+        merged = merged[dropped:]
+    return merged
+
+
+async def _insert_silent(
+    collection: StandardCollection, document: Dict[str, Any]
+) -> str:
+    """Insert without a response body, returning the client-generated key"""
+    document.setdefault("_key", uuid.uuid4().hex)
+    await collection.insert(document, silent=True)
+    return document["_key"]
+
+
+def _first(cursor: Cursor, default: Any = None) -> Any:
+    """Return the first row of a query whose result fits in one batch"""
+    batch = cursor.batch
+    return batch[0] if batch else default
+
+
+async def _collect(cursor: Cursor) -> List[Any]:
+    """Read every row of a cursor, fetching whole batches instead of row by row"""
+    try:
+        while cursor.has_more:
+            await cursor.fetch()
+    except BaseException:
+        # A drained cursor is freed by the server; only close one left open
+        await cursor.close(ignore_missing=True)
+        raise
+    return list(cursor.batch)
+
 
 class Database:
     """ArangoDB database connection and operations"""
@@ -37,182 +325,253 @@ class Database:
         self.comments_collection: Optional[StandardCollection] = None
         self.likes_collection: Optional[StandardCollection] = None
         self.comment_likes_collection: Optional[StandardCollection] = None
+        # "id:<key>" / "name:<username>" -> (cached_at, user document)
+        self._user_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # key_hash -> (cached_at, active API key document); reset by revoke_api_key
+        self._api_key_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = (
+            OrderedDict()
+        )
+        # (cached_at, directory documents); reset by add/delete_directory
+        self._directories_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        # Pending download history / API usage records, API key last-used
+        # timestamps (key -> time), and the task that flushes them
+        self._download_buffer: List[Dict[str, Any]] = []
+        self._api_usage_buffer: List[Dict[str, Any]] = []
+        self._api_key_last_used: Dict[str, str] = {}
+        self._flush_wakeup = asyncio.Event()
+        self._flush_stop = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Pings the server while the app is running; see KEEPALIVE_INTERVAL
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # name -> (computed_at, value) for site-wide statistics, plus one lock per
+        # name so concurrent callers share a single computation
+        self._stats_cache: Dict[str, Tuple[float, Any]] = {}
+        self._stats_locks: Dict[str, asyncio.Lock] = {}
+        # Query strings the server refused to plan-cache; run without the option
+        self._plan_cache_skip: set = set()
+        # Set once connect() succeeds; the lock keeps concurrent first calls
+        # from connecting twice
+        self._connected = asyncio.Event()
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self):
-        """Connect to ArangoDB and initialize database/collections"""
+        """Connect to ArangoDB and initialize database/collections
+
+        Calling connect() while already connected is a no-op; disconnect()
+        first to pick up new settings.
+        """
+        async with self._connect_lock:
+            if not self._connected.is_set():
+                await self._connect()
+
+    async def _connect(self):
+        """Open the client, database and collections (caller holds the lock)"""
         try:
-            # Initialize ArangoDB client
-            self.client = ArangoClient(hosts=Config.get_arangodb_url())
+            # Reuse the shared ArangoDB client for this URL
+            self.client = _get_client(CONFIG.arango_url)
 
             # Create auth object
             auth = Auth(
-                username=Config.ARANGODB_USERNAME(), password=Config.ARANGODB_PASSWORD()
+                username=CONFIG.arango_username, password=CONFIG.arango_password
             )
 
             # Connect to _system database to check if our database exists
             sys_db = await self.client.db("_system", auth=auth)
 
-            # Create database if it doesn't exist
-            if not await sys_db.has_database(Config.ARANGODB_DATABASE()):
-                await sys_db.create_database(Config.ARANGODB_DATABASE())
-                logger.info(f"Created database: {Config.ARANGODB_DATABASE()}")
+            # Create the database, treating "duplicate name" as already present
+            try:
+                await sys_db.create_database(CONFIG.arango_database)
+                logger.info("Created database: %s", CONFIG.arango_database)
+            except DatabaseCreateError as e:
+                if e.error_code != DUPLICATE_NAME:
+                    raise
 
             # Connect to the application database
-            self.db = await self.client.db(Config.ARANGODB_DATABASE(), auth=auth)
+            self.db = await self.client.db(CONFIG.arango_database, auth=auth)
 
-            # Create entries collection if it doesn't exist
-            if not await self.db.has_collection("entries"):
-                self.entries_collection = await self.db.create_collection("entries")
-                logger.info("Created collection: entries")
-            else:
-                self.entries_collection = self.db.collection("entries")
+            for name in COLLECTIONS:
+                setattr(self, f"{name}_collection", self.db.collection(name))
 
-            # Create users collection if it doesn't exist
-            if not await self.db.has_collection("users"):
-                self.users_collection = await self.db.create_collection("users")
-                logger.info("Created collection: users")
-            else:
-                self.users_collection = self.db.collection("users")
+            # List the collections once, then create the missing ones concurrently
+            existing = {
+                info.name for info in await self.db.collections(exclude_system=True)
+            }
+            missing = [name for name in COLLECTIONS if name not in existing]
+            created = await asyncio.gather(
+                *(self._create_collection(name) for name in missing)
+            )
+            missing = [name for name, new in zip(missing, created) if new]
+            if missing:
+                logger.info("Created collections: %s", ", ".join(missing))
 
-            # Create directories collection if it doesn't exist
-            if not await self.db.has_collection("directories"):
-                self.directories_collection = await self.db.create_collection(
-                    "directories"
-                )
-                logger.info("Created collection: directories")
-            else:
-                self.directories_collection = self.db.collection("directories")
+            await asyncio.gather(self._ensure_indexes(), self._enable_query_cache())
 
-            # Create download_history collection if it doesn't exist
-            if not await self.db.has_collection("download_history"):
-                self.download_history_collection = await self.db.create_collection(
-                    "download_history"
-                )
-                logger.info("Created collection: download_history")
-            else:
-                self.download_history_collection = self.db.collection(
-                    "download_history"
-                )
+            if self._keepalive_task is None:
+                self._keepalive_task = asyncio.create_task(self._keepalive_loop())
 
-            # Create requests collection if it doesn't exist
-            if not await self.db.has_collection("requests"):
-                self.requests_collection = await self.db.create_collection("requests")
-                logger.info("Created collection: requests")
-            else:
-                self.requests_collection = self.db.collection("requests")
+            self._connected.set()
+            logger.info("Successfully connected to ArangoDB")
 
-            # Create api_keys collection if it doesn't exist
-            if not await self.db.has_collection("api_keys"):
-                self.api_keys_collection = await self.db.create_collection("api_keys")
-                logger.info("Created collection: api_keys")
-            else:
-                self.api_keys_collection = self.db.collection("api_keys")
+        except Exception as e:
+            logger.error("Failed to connect to ArangoDB: %s", e)
+            raise
 
-            # Create api_usage collection if it doesn't exist
-            if not await self.db.has_collection("api_usage"):
-                self.api_usage_collection = await self.db.create_collection("api_usage")
-                logger.info("Created collection: api_usage")
-            else:
-                self.api_usage_collection = self.db.collection("api_usage")
+    async def ensure_connected(self):
+        """Connect on first use; returns immediately once connected"""
+        if not self._connected.is_set():
+            await self.connect()
 
-            # Create audit_logs collection if it doesn't exist
-            if not await self.db.has_collection("audit_logs"):
-                self.audit_logs_collection = await self.db.create_collection(
-                    "audit_logs"
-                )
-                logger.info("Created collection: audit_logs")
-            else:
-                self.audit_logs_collection = self.db.collection("audit_logs")
+    async def _create_collection(self, name: str) -> bool:
+        """Create a collection in one round trip, returning False if it exists"""
+        try:
+            await self.db.create_collection(name)
+            return True
+        except CollectionCreateError as e:
+            if e.error_code == DUPLICATE_NAME:
+                return False
+            raise
 
-            # Create activity_logs collection if it doesn't exist
-            if not await self.db.has_collection("activity_logs"):
-                self.activity_logs_collection = await self.db.create_collection(
-                    "activity_logs"
-                )
-                logger.info("Created collection: activity_logs")
-            else:
-                self.activity_logs_collection = self.db.collection("activity_logs")
+    async def _ensure_indexes(self):
+        """Create persistent indexes for lookup queries (no-op if they exist)"""
 
-            # Create upload_statistics collection if it doesn't exist
-            if not await self.db.has_collection("upload_statistics"):
-                self.upload_statistics_collection = await self.db.create_collection(
-                    "upload_statistics"
-                )
-                logger.info("Created collection: upload_statistics")
-            else:
-                self.upload_statistics_collection = self.db.collection(
-                    "upload_statistics"
+        async def ensure(name: str, fields: List[str], unique: bool):
+            try:
+                # Build in the background so writes are not blocked at startup
+                await self.db.collection(name).add_index(
+                    type="persistent",
+                    fields=fields,
+                    options={"unique": unique, "inBackground": True},
                 )
+            except IndexCreateError as e:
+                logger.warning("Could not create index on %s%s: %s", name, fields, e)
 
-            # Create reports collection if it doesn't exist
-            if not await self.db.has_collection("reports"):
-                self.reports_collection = await self.db.create_collection("reports")
-                logger.info("Created collection: reports")
-            else:
-                self.reports_collection = self.db.collection("reports")
-
-            # Create comments collection if it doesn't exist
-            if not await self.db.has_collection("comments"):
-                self.comments_collection = await self.db.create_collection("comments")
-                logger.info("Created collection: comments")
-            else:
-                self.comments_collection = self.db.collection("comments")
+        await asyncio.gather(*(ensure(*spec) for spec in INDEXES))
 
-            # Create likes collection if it doesn't exist
-            if not await self.db.has_collection("likes"):
-                self.likes_collection = await self.db.create_collection("likes")
-                logger.info("Created collection: likes")
-            else:
-                self.likes_collection = self.db.collection("likes")
-
-            # Create comment_likes collection if it doesn't exist
-            if not await self.db.has_collection("comment_likes"):
-                self.comment_likes_collection = await self.db.create_collection("comment_likes")
-                logger.info("Created collection: comment_likes")
-            else:
-                self.comment_likes_collection = self.db.collection("comment_likes")
+    async def _enable_query_cache(self):
+        """Switch the AQL result cache to demand mode if the server has it off"""
+        try:
+            properties = await self.db.aql.cache.properties()
+            if properties.mode == "off":
+                await self.db.aql.cache.configure(mode="demand")
+        except (AQLCacheConfigureError, AQLCachePropertiesError) as e:
+            logger.warning("Could not enable the AQL query cache: %s", e)
 
-            logger.info("Successfully connected to ArangoDB")
+    async def _execute(
+        self, query: str, bind_vars: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Cursor:
+        """Run a read query, reusing the server's cached execution plan when allowed
 
-        except Exception as e:
-            logger.error(f"Failed to connect to ArangoDB: {e}")
-            raise
+        The plan cache (ArangoDB 3.12.4+) skips parsing and optimizing repeated
+        queries; older servers ignore the option.
+        """
+        if query not in self._plan_cache_skip:
+            try:
+                return await self.db.aql.execute(
+                    query,
+                    bind_vars=bind_vars,
+                    options={"usePlanCache": True},
+                    **kwargs,
+                )
+            except AQLQueryExecuteError as e:
+                if e.error_code != QUERY_NOT_ELIGIBLE_FOR_PLAN_CACHING:
+                    raise
+                self._plan_cache_skip.add(query)
+        return await self.db.aql.execute(query, bind_vars=bind_vars, **kwargs)
+
+    async def _cached_stats(
+        self, name: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached aggregate, recomputing it once per STATS_CACHE_TTL"""
+        hit = self._stats_cache.get(name)
+        if hit is not None and time.monotonic() - hit[0] < STATS_CACHE_TTL:
+            return hit[1]
+        async with self._stats_locks.setdefault(name, asyncio.Lock()):
+            # Another caller may have refreshed it while we waited
+            hit = self._stats_cache.get(name)
+            if hit is not None and time.monotonic() - hit[0] < STATS_CACHE_TTL:
+                return hit[1]
+            value = await compute()
+            self._stats_cache[name] = (time.monotonic(), value)
+            return value
+
+    async def _keepalive_loop(self):
+        """Issue a cheap request periodically so idle pooled connections stay warm"""
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            try:
+                await self.db.version()
+            except Exception as e:
+                logger.debug("ArangoDB keepalive ping failed: %s", e)
 
     async def disconnect(self):
-        """Close database connection"""
-        if self.client:
-            await self.client.close()
-            logger.info("Disconnected from ArangoDB")
+        """Release this instance's connection (no-op if not connected)"""
+        async with self._connect_lock:
+            if self._keepalive_task:
+                self._keepalive_task.cancel()
+                try:
+                    await self._keepalive_task
+                except asyncio.CancelledError:
+                    pass
+                self._keepalive_task = None
+            if self._flush_task:
+                # Let a flush that is already writing finish instead of
+                # cancelling it mid-request and losing its batch
+                self._flush_stop.set()
+                self._flush_wakeup.set()
+                await self._flush_task
+                self._flush_task = None
+                self._flush_stop.clear()
+            if self.client:
+                await self._flush_buffers()
+
+            if self.client:
+                # The client is shared with other instances; only drop our
+                # reference here and let close_clients() close it at shutdown
+                self.client = None
+                self.db = None
+                self._connected.clear()
+                logger.info("Disconnected from ArangoDB")
 
     async def get_all_entries(self) -> List[Dict[str, Any]]:
         """Get all entries from the database"""
         try:
             cursor = await self.db.aql.execute(
-                "FOR doc IN entries SORT doc.size DESC RETURN doc"
+                ENTRY_LIST_QUERY,
+                batch_size=LARGE_BATCH_SIZE,
+                options={"stream": True},
             )
-            entries = []
-            async with cursor:
-                async for doc in cursor:
-                    # Convert _key to id for API response
-                    entry = {
-                        "id": doc.get("_key"),
-                        "name": doc.get("name"),
-                        "source": doc.get("source"),
-                        "type": doc.get("type"),
-                        "file_type": doc.get("file_type"),
-                        "size": doc.get("size"),
-                        "created_at": doc.get("created_at"),
-                        "created_by": doc.get("created_by", ""),
-                        "metadata": doc.get("metadata", {}),
-                    }
-                    entries.append(entry)
-            return entries
-        except Exception as e:
-            logger.error(f"Error fetching entries: {e}")
+            return await _collect(cursor)
+        except Exception as e:
+            logger.error("Error fetching entries: %s", e)
             return []
 
+    async def iter_entries(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield entries one at a time, optionally only the page at offset/limit"""
+        if limit is None and not offset:
+            query, bind_vars = ENTRY_LIST_QUERY, None
+        else:
+            # AQL needs an explicit count, so an open-ended page gets a huge one
+            query = ENTRY_PAGE_QUERY
+            bind_vars = {
+                "offset": offset,
+                "limit": 2**31 if limit is None else limit,
+            }
+        cursor = await self.db.aql.execute(
+            query,
+            bind_vars=bind_vars,
+            batch_size=LARGE_BATCH_SIZE,
+            options={"stream": True},
+        )
+        async with cursor:
+            async for doc in cursor:
+                yield doc
+
     async def get_entry_by_id(self, entry_id: str) -> Optional[Dict[str, Any]]:
         """Get a single entry by its ID"""
+        if not entry_id:
+            return None
         try:
             doc = await self.entries_collection.get(entry_id)
             if doc:
@@ -234,8 +593,14 @@ class Database:
                     "file_modified_at": doc.get("file_modified_at"),
                 }
             return None
+        except DocumentParseError:
+            return None
         except Exception as e:
-            logger.error(f"Error fetching entry by ID: {e}")
+            # Malformed keys come back as 400/404; treat them as a plain miss
+            if isinstance(e, DocumentGetError) and e.http_code in (400, 404):
+                logger.debug("Entry %s not found: %s", entry_id, e)
+            else:
+                logger.error("Error fetching entry by ID: %s", e)
             return None
 
     async def add_entry(self, entry_data: Dict[str, Any]) -> Optional[str]:
@@ -243,33 +608,63 @@ class Database:
         try:
             # Add timestamp if not provided
             if "created_at" not in entry_data:
-                entry_data["created_at"] = datetime.utcnow().isoformat()
+                entry_data["created_at"] = now_iso()
 
-            result = await self.entries_collection.insert(entry_data)
-            logger.info(f"Added entry with key: {result['_key']}")
-            return result["_key"]
+            key = await _insert_silent(self.entries_collection, entry_data)
+            logger.debug("Added entry with key: %s", key)
+            return key
         except Exception as e:
-            logger.error(f"Error adding entry: {e}")
+            logger.error("Error adding entry: %s", e)
             return None
 
+    async def import_entries(self, entries: List[Dict[str, Any]]) -> int:
+        """Bulk insert entries without returning their keys, returning the count added"""
+        added = 0
+        created_at = now_iso()
+        try:
+            for start in range(0, len(entries), BULK_INSERT_BATCH_SIZE):
+                batch = entries[start : start + BULK_INSERT_BATCH_SIZE]
+                for entry_data in batch:
+                    entry_data.setdefault("created_at", created_at)
+
+                # silent=True makes the server report only the failed documents
+                errors = await self.entries_collection.insert_many(batch, silent=True)
+                for error in errors:
+                    logger.error(
+                        "Error adding entry: %s",
+                        error.get("errorMessage", "Unknown error"),
+                    )
+                added += len(batch) - len(errors)
+
+            self._stats_cache.pop("system", None)
+            logger.info("Imported %s entries", added)
+            return added
+        except Exception as e:
+            logger.error("Error importing entries: %s", e)
+            if added:
+                self._stats_cache.pop("system", None)
+            return added
+
     async def delete_entry(self, entry_id: str) -> bool:
         """Delete an entry from the database"""
         try:
             await self.entries_collection.delete(entry_id)
-            logger.info(f"Deleted entry: {entry_id}")
+            logger.info("Deleted entry: %s", entry_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting entry: {e}")
+            logger.error("Error deleting entry: %s", e)
             return False
 
     async def mark_entry_corrupt(self, entry_id: str, corrupt: bool = True) -> bool:
         """Mark an entry as corrupt or not corrupt"""
         try:
-            await self.entries_collection.update({"_key": entry_id, "corrupt": corrupt})
-            logger.info(f"Updated entry {entry_id} corrupt status to {corrupt}")
+            await self.entries_collection.update(
+                {"_key": entry_id, "corrupt": corrupt}, silent=True
+            )
+            logger.info("Updated entry %s corrupt status to %s", entry_id, corrupt)
             return True
         except Exception as e:
-            logger.error(f"Error updating entry corrupt status: {e}")
+            logger.error("Error updating entry corrupt status: %s", e)
             return False
 
     async def update_entry_hashes(
@@ -287,12 +682,12 @@ class Database:
                 update_data["sha256_hash"] = sha256_hash
 
             if len(update_data) > 1:  # More than just _key
-                await self.entries_collection.update(update_data)
-                logger.info(f"Updated hashes for entry {entry_id}")
+                await self.entries_collection.update(update_data, silent=True)
+                logger.debug("Updated hashes for entry %s", entry_id)
                 return True
             return False
         except Exception as e:
-            logger.error(f"Error updating entry hashes: {e}")
+            logger.error("Error updating entry hashes: %s", e)
             return False
 
     async def get_corrupt_entries(self) -> List[Dict[str, Any]]:
@@ -314,14 +709,10 @@ class Database:
                 report_count: report_count
             })
             """
-            cursor = await self.db.aql.execute(query)
-            entries = []
-            async with cursor:
-                async for entry in cursor:
-                    entries.append(entry)
-            return entries
+            cursor = await self.db.aql.execute(query, batch_size=LARGE_BATCH_SIZE)
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching corrupt entries: {e}")
+            logger.error("Error fetching corrupt entries: %s", e)
             return []
 
     async def clear_all_corrupt_flags(self) -> int:
@@ -344,11 +735,7 @@ class Database:
             RETURN LENGTH(updated)
             """
             cursor = await self.db.aql.execute(query)
-            count = 0
-            async with cursor:
-                async for result in cursor:
-                    count = result
-                    break
+            count = _first(cursor, 0)
 
             # Step 2: Clear the entire reports collection
             delete_query = """
@@ -358,82 +745,125 @@ class Database:
             await self.db.aql.execute(delete_query)
 
             logger.info(
-                f"Cleared corrupt flag from {count} entries, moved reports to oldReports, and cleared reports collection"
+                "Cleared corrupt flag from %s entries, moved reports to oldReports, and cleared reports collection",
+                count,
             )
             return count
         except Exception as e:
-            logger.error(f"Error clearing all corrupt flags: {e}")
+            logger.error("Error clearing all corrupt flags: %s", e)
             return 0
 
+    # User cache helpers
+    def _get_cached_user(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached user document if it is still fresh"""
+        hit = self._user_cache.get(cache_key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] >= USER_CACHE_TTL:
+            del self._user_cache[cache_key]
+            return None
+        self._user_cache.move_to_end(cache_key)
+        return hit[1]
+
+    def _cache_user(self, doc: Dict[str, Any]):
+        """Cache a user document under both its key and its username"""
+        now = time.monotonic()
+        for cache_key in (f"id:{doc.get('_key')}", f"name:{doc.get('username')}"):
+            self._user_cache[cache_key] = (now, doc)
+            self._user_cache.move_to_end(cache_key)
+        while len(self._user_cache) > USER_CACHE_SIZE:
+            self._user_cache.popitem(last=False)
+
+    def _evict_user(self, user_id: str):
+        """Drop every cached copy of a user after it has been modified"""
+        stale = [
+            cache_key
+            for cache_key, (_, doc) in self._user_cache.items()
+            if doc.get("_key") == user_id
+        ]
+        for cache_key in stale:
+            del self._user_cache[cache_key]
+
     # User management methods
     async def create_user(self, user_data: Dict[str, Any]) -> Optional[str]:
         """Create a new user"""
         try:
             # Add timestamp if not provided
             if "created_at" not in user_data:
-                user_data["created_at"] = datetime.utcnow().isoformat()
+                user_data["created_at"] = now_iso()
 
-            result = await self.users_collection.insert(user_data)
-            logger.info(f"Created user: {user_data['username']}")
-            return result["_key"]
+            key = await _insert_silent(self.users_collection, user_data)
+            self._user_cache.pop(f"name:{user_data['username']}", None)
+            logger.debug("Created user: %s", user_data["username"])
+            return key
         except Exception as e:
-            logger.error(f"Error creating user: {e}")
+            logger.error("Error creating user: %s", e)
             return None
 
     async def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get a user by username"""
+        cached = self._get_cached_user(f"name:{username}")
+        if cached is not None:
+            return cached
+
         try:
-            cursor = await self.db.aql.execute(
-                "FOR doc IN users FILTER doc.username == @username LIMIT 1 RETURN doc",
-                bind_vars={"username": username},
-            )
-            async with cursor:
-                async for doc in cursor:
-                    return doc
-            return None
+            cursor = await self.users_collection.find({"username": username}, limit=1)
+            doc = _first(cursor)
+            if doc is not None:
+                self._cache_user(doc)
+            return doc
         except Exception as e:
-            logger.error(f"Error fetching user: {e}")
+            logger.error("Error fetching user: %s", e)
             return None
 
     async def user_exists(self, username: str) -> bool:
         """Check if a user exists"""
-        user = await self.get_user_by_username(username)
-        return user is not None
+        if self._get_cached_user(f"name:{username}") is not None:
+            return True
+        try:
+            cursor = await self.db.aql.execute(
+                USER_EXISTS_QUERY,
+                bind_vars={"username": username},
+                cache=True,
+            )
+            return _first(cursor, False)
+        except Exception as e:
+            logger.error("Error checking user existence: %s", e)
+            return False
 
     # Directory management methods
     async def add_directory(self, path: str) -> Optional[str]:
         """Add a new directory to scan"""
         try:
-            # Check if directory already exists
-            existing = await self.get_directory_by_path(path)
-            if existing:
-                logger.warning(f"Directory already exists: {path}")
-                return existing.get("_key")
-
-            directory_data = {
-                "path": path,
-                "added_at": datetime.utcnow().isoformat(),
-            }
-            result = await self.directories_collection.insert(directory_data)
-            logger.info(f"Added directory: {path}")
-            return result["_key"]
+            # Insert-if-missing in one round trip; UPDATE {} leaves existing rows as-is
+            query = """
+            UPSERT { path: @path }
+            INSERT { path: @path, added_at: @added_at }
+            UPDATE {} IN directories
+            RETURN { key: NEW._key, existed: OLD != null }
+            """
+            cursor = await self.db.aql.execute(
+                query, bind_vars={"path": path, "added_at": now_iso()}
+            )
+            result = _first(cursor)
+            if result["existed"]:
+                logger.warning("Directory already exists: %s", path)
+            else:
+                self._directories_cache = None
+                self._stats_cache.pop("system", None)
+                logger.debug("Added directory: %s", path)
+            return result["key"]
         except Exception as e:
-            logger.error(f"Error adding directory: {e}")
+            logger.error("Error adding directory: %s", e)
             return None
 
     async def get_directory_by_path(self, path: str) -> Optional[Dict[str, Any]]:
         """Get a directory by path"""
         try:
-            cursor = await self.db.aql.execute(
-                "FOR doc IN directories FILTER doc.path == @path LIMIT 1 RETURN doc",
-                bind_vars={"path": path},
-            )
-            async with cursor:
-                async for doc in cursor:
-                    return doc
-            return None
+            cursor = await self.directories_collection.find({"path": path}, limit=1)
+            return _first(cursor)
         except Exception as e:
-            logger.error(f"Error fetching directory: {e}")
+            logger.error("Error fetching directory: %s", e)
             return None
 
     async def get_directory_by_id(self, directory_id: str) -> Optional[Dict[str, Any]]:
@@ -442,23 +872,24 @@ class Database:
             doc = await self.directories_collection.get(directory_id)
             return doc
         except Exception as e:
-            logger.error(f"Error fetching directory by ID: {e}")
+            logger.error("Error fetching directory by ID: %s", e)
             return None
 
     async def get_all_directories(self) -> List[Dict[str, Any]]:
         """Get all directories"""
-        try:
-            cursor = await self.db.aql.execute(
-                "FOR doc IN directories SORT doc.added_at DESC RETURN doc"
-            )
-            directories = []
-            async with cursor:
-                async for doc in cursor:
-                    directories.append(doc)
-            return directories
-        except Exception as e:
-            logger.error(f"Error fetching directories: {e}")
-            return []
+        cached = self._directories_cache
+        if cached is None or time.monotonic() - cached[0] >= DIRECTORY_CACHE_TTL:
+            try:
+                cursor = await self.db.aql.execute(
+                    DIRECTORY_LIST_QUERY, batch_size=LARGE_BATCH_SIZE, cache=True
+                )
+                directories = await _collect(cursor)
+            except Exception as e:
+                logger.error("Error fetching directories: %s", e)
+                return []
+            cached = self._directories_cache = (time.monotonic(), directories)
+        # Callers annotate the dicts in place, so hand out copies
+        return [dict(doc) for doc in cached[1]]
 
     async def get_directories_with_storage_info(self) -> List[Dict[str, Any]]:
         """Get all directories with storage information"""
@@ -489,46 +920,66 @@ class Database:
                         }
                     )
                 except Exception as e:
-                    logger.warning(f"Could not get storage info for {path}: {e}")
+                    logger.warning("Could not get storage info for %s: %s", path, e)
 
             return result
         except Exception as e:
-            logger.error(f"Error fetching directories with storage info: {e}")
+            logger.error("Error fetching directories with storage info: %s", e)
             return []
 
     async def delete_directory(self, directory_id: str) -> bool:
         """Delete a directory"""
         try:
             await self.directories_collection.delete(directory_id)
-            logger.info(f"Deleted directory: {directory_id}")
+            self._directories_cache = None
+            self._stats_cache.pop("system", None)
+            logger.info("Deleted directory: %s", directory_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting directory: {e}")
+            logger.error("Error deleting directory: %s", e)
             return False
 
     async def clear_all_entries(self) -> bool:
         """Clear all entries from the database"""
         try:
-            await self.db.aql.execute("FOR doc IN entries REMOVE doc IN entries")
+            await self.entries_collection.truncate()
+            self._stats_cache.pop("system", None)
             logger.info("Cleared all entries")
             return True
         except Exception as e:
-            logger.error(f"Error clearing entries: {e}")
+            logger.error("Error clearing entries: %s", e)
             return False
 
+    async def count_entries(self) -> int:
+        """Count all entries"""
+        try:
+            return await self.entries_collection.count()
+        except Exception as e:
+            logger.error("Error counting entries: %s", e)
+            return 0
+
     async def entry_exists(self, source: str) -> bool:
         """Check if an entry with this source already exists"""
         try:
             cursor = await self.db.aql.execute(
-                "FOR doc IN entries FILTER doc.source == @source LIMIT 1 RETURN doc",
+                ENTRY_EXISTS_QUERY,
                 bind_vars={"source": source},
+                cache=True,
             )
-            async with cursor:
-                async for doc in cursor:
-                    return True
+            return _first(cursor, False)
+        except Exception as e:
+            logger.error("Error checking entry existence: %s", e)
             return False
+
+    async def entry_name_exists(self, name: str) -> bool:
+        """Check if an entry with this name already exists"""
+        try:
+            cursor = await self.db.aql.execute(
+                ENTRY_NAME_EXISTS_QUERY, bind_vars={"name": name}
+            )
+            return _first(cursor, False)
         except Exception as e:
-            logger.error(f"Error checking entry existence: {e}")
+            logger.error("Error checking entry name existence: %s", e)
             return False
 
     # User settings methods
@@ -536,12 +987,13 @@ class Database:
         """Update a user's password"""
         try:
             await self.users_collection.update(
-                {"_key": user_id, "password_hash": new_password_hash}
+                {"_key": user_id, "password_hash": new_password_hash}, silent=True
             )
-            logger.info(f"Updated password for user: {user_id}")
+            self._evict_user(user_id)
+            logger.info("Updated password for user: %s", user_id)
             return True
         except Exception as e:
-            logger.error(f"Error updating password: {e}")
+            logger.error("Error updating password: %s", e)
             return False
 
     async def update_user_totp(
@@ -554,42 +1006,147 @@ class Database:
                     "_key": user_id,
                     "totp_secret": totp_secret,
                     "totp_enabled": totp_enabled,
-                }
+                },
+                silent=True,
             )
-            logger.info(f"Updated TOTP settings for user: {user_id}")
+            self._evict_user(user_id)
+            logger.info("Updated TOTP settings for user: %s", user_id)
             return True
         except Exception as e:
-            logger.error(f"Error updating TOTP settings: {e}")
+            logger.error("Error updating TOTP settings: %s", e)
             return False
 
     async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get a user by ID"""
+        if not user_id:
+            return None
+        cached = self._get_cached_user(f"id:{user_id}")
+        if cached is not None:
+            return cached
+
         try:
             doc = await self.users_collection.get(user_id)
+            if doc:
+                self._cache_user(doc)
             return doc
+        except DocumentParseError:
+            return None
         except Exception as e:
-            logger.error(f"Error fetching user by ID: {e}")
+            # Malformed keys come back as 400/404; treat them as a plain miss
+            if isinstance(e, DocumentGetError) and e.http_code in (400, 404):
+                logger.debug("User %s not found: %s", user_id, e)
+            else:
+                logger.error("Error fetching user by ID: %s", e)
             return None
 
+    async def get_users_by_ids(self, user_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several users by ID in a single query"""
+        ids = list(dict.fromkeys(user_ids))
+        if not ids:
+            return []
+        try:
+            cursor = await self.db.aql.execute(
+                USER_MANY_QUERY,
+                bind_vars={"ids": ids},
+                batch_size=min(len(ids), LARGE_BATCH_SIZE),
+            )
+            users = await _collect(cursor)
+            for user in users:
+                self._cache_user(user)
+            return users
+        except Exception as e:
+            logger.error("Error fetching users by ID: %s", e)
+            return []
+
     # Download history methods
     async def add_download_history(
         self, user_id: str, entry_id: str, entry_name: str, size_bytes: int = 0
     ) -> Optional[str]:
-        """Add a download history record"""
-        try:
-            download_data = {
+        """Queue a download history record, returning the key it will be stored under"""
+        key = uuid.uuid4().hex
+        self._download_buffer.append(
+            {
+                "_key": key,
                 "user_id": user_id,
                 "entry_id": entry_id,
                 "entry_name": entry_name,
                 "size_bytes": size_bytes,
-                "downloaded_at": datetime.utcnow().isoformat(),
+                "downloaded_at": now_iso(),
             }
-            result = await self.download_history_collection.insert(download_data)
-            logger.info(f"Added download history for user {user_id}, entry {entry_id}")
-            return result["_key"]
+        )
+        self._schedule_flush(len(self._download_buffer))
+        return key
+
+    def _schedule_flush(self, pending: int):
+        """Start the flush task on first use and wake it early once a buffer fills"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        if pending >= WRITE_BUFFER_FLUSH_SIZE:
+            self._flush_wakeup.set()
+
+    async def _flush_loop(self):
+        """Write buffered records every interval or when a buffer fills"""
+        while not self._flush_stop.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._flush_wakeup.wait(),
+                    timeout=WRITE_BUFFER_FLUSH_INTERVAL,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_wakeup.clear()
+            if self._flush_stop.is_set():
+                # disconnect() does the final drain
+                break
+            try:
+                await self._flush_buffers()
+            except Exception as e:
+                logger.error("Error flushing write buffers: %s", e)
+
+    async def _flush_buffers(self):
+        """Flush every write buffer concurrently"""
+        await asyncio.gather(
+            self._flush_download_history(),
+            self._flush_api_usage(),
+            self._flush_api_key_last_used(),
+        )
+
+    async def _flush_download_history(self):
+        """Insert all buffered download history records in one request"""
+        if not self._download_buffer:
+            return
+        batch, self._download_buffer = self._download_buffer, []
+        try:
+            added = await self._insert_download_history(batch)
+            logger.debug("Flushed %s download history records", added)
+        except Exception as e:
+            logger.error("Error adding download history: %s", e)
+            self._download_buffer = _requeue(
+                batch, self._download_buffer, "download history"
+            )
+
+    async def add_download_history_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """Insert many download history records at once, returning the count added"""
+        try:
+            return await self._insert_download_history(records)
         except Exception as e:
-            logger.error(f"Error adding download history: {e}")
-            return None
+            logger.error("Error adding download history: %s", e)
+            return 0
+
+    async def _insert_download_history(self, records: List[Dict[str, Any]]) -> int:
+        """Insert download history records, raising if the request itself fails"""
+        downloaded_at = now_iso()
+        for record in records:
+            record.setdefault("downloaded_at", downloaded_at)
+        errors = await self.download_history_collection.insert_many(
+            records, silent=True
+        )
+        for error in errors:
+            logger.error(
+                "Error adding download history: %s",
+                error.get("errorMessage", "Unknown error"),
+            )
+        return len(records) - len(errors)
 
     async def get_user_download_history(
         self, user_id: str, limit: int = 100
@@ -597,23 +1154,13 @@ class Database:
         """Get download history for a user"""
         try:
             cursor = await self.db.aql.execute(
-                "FOR doc IN download_history FILTER doc.user_id == @user_id SORT doc.downloaded_at DESC LIMIT @limit RETURN doc",
+                DOWNLOAD_HISTORY_QUERY,
                 bind_vars={"user_id": user_id, "limit": limit},
+                cache=True,
             )
-            history = []
-            async with cursor:
-                async for doc in cursor:
-                    history.append(
-                        {
-                            "id": doc.get("_key"),
-                            "entry_id": doc.get("entry_id"),
-                            "entry_name": doc.get("entry_name"),
-                            "downloaded_at": doc.get("downloaded_at"),
-                        }
-                    )
-            return history
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching download history: {e}")
+            logger.error("Error fetching download history: %s", e)
             return []
 
     # Request management methods
@@ -621,13 +1168,13 @@ class Database:
         """Create a new request"""
         try:
             if "created_at" not in request_data:
-                request_data["created_at"] = datetime.utcnow().isoformat()
+                request_data["created_at"] = now_iso()
 
-            result = await self.requests_collection.insert(request_data)
-            logger.info(f"Created request with key: {result['_key']}")
-            return result["_key"]
+            key = await _insert_silent(self.requests_collection, request_data)
+            logger.info("Created request with key: %s", key)
+            return key
         except Exception as e:
-            logger.error(f"Error creating request: {e}")
+            logger.error("Error creating request: %s", e)
             return None
 
     async def get_all_requests(
@@ -639,40 +1186,32 @@ class Database:
                 cursor = await self.db.aql.execute(
                     "FOR doc IN requests FILTER doc.status == @status SORT doc.created_at DESC RETURN doc",
                     bind_vars={"status": status},
+                    batch_size=LARGE_BATCH_SIZE,
                 )
             else:
                 cursor = await self.db.aql.execute(
-                    "FOR doc IN requests SORT doc.created_at DESC RETURN doc"
+                    "FOR doc IN requests SORT doc.created_at DESC RETURN doc",
+                    batch_size=LARGE_BATCH_SIZE,
                 )
 
-            requests = []
-            async with cursor:
-                async for doc in cursor:
-                    requests.append(doc)
-            return requests
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching requests: {e}")
+            logger.error("Error fetching requests: %s", e)
             return []
 
     async def count_requests(self, status: Optional[str] = None) -> int:
         """Count requests, optionally filtered by status"""
         try:
-            if status:
-                cursor = await self.db.aql.execute(
-                    "FOR doc IN requests FILTER doc.status == @status COLLECT WITH COUNT INTO length RETURN length",
-                    bind_vars={"status": status},
-                )
-            else:
-                cursor = await self.db.aql.execute(
-                    "FOR doc IN requests COLLECT WITH COUNT INTO length RETURN length"
-                )
+            if not status:
+                return await self.requests_collection.count()
 
-            async with cursor:
-                async for count in cursor:
-                    return count
-            return 0
+            cursor = await self.db.aql.execute(
+                "FOR doc IN requests FILTER doc.status == @status COLLECT WITH COUNT INTO length RETURN length",
+                bind_vars={"status": status},
+            )
+            return _first(cursor, 0)
         except Exception as e:
-            logger.error(f"Error counting requests: {e}")
+            logger.error("Error counting requests: %s", e)
             return 0
 
     async def get_request_by_id(self, request_id: str) -> Optional[Dict[str, Any]]:
@@ -681,7 +1220,7 @@ class Database:
             doc = await self.requests_collection.get(request_id)
             return doc
         except Exception as e:
-            logger.error(f"Error fetching request by ID: {e}")
+            logger.error("Error fetching request by ID: %s", e)
             return None
 
     async def update_request_status(
@@ -694,13 +1233,14 @@ class Database:
                     "_key": request_id,
                     "status": status,
                     "reviewed_by": reviewed_by,
-                    "reviewed_at": datetime.utcnow().isoformat(),
+                    "reviewed_at": now_iso(),
                 },
+                silent=True,
             )
-            logger.info(f"Updated request {request_id} status to {status}")
+            logger.info("Updated request %s status to %s", request_id, status)
             return True
         except Exception as e:
-            logger.error(f"Error updating request status: {e}")
+            logger.error("Error updating request status: %s", e)
             return False
 
     async def get_user_requests(self, user_id: str) -> List[Dict[str, Any]]:
@@ -710,13 +1250,9 @@ class Database:
                 "FOR doc IN requests FILTER doc.user_id == @user_id SORT doc.created_at DESC RETURN doc",
                 bind_vars={"user_id": user_id},
             )
-            requests = []
-            async with cursor:
-                async for doc in cursor:
-                    requests.append(doc)
-            return requests
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching user requests: {e}")
+            logger.error("Error fetching user requests: %s", e)
             return []
 
     async def update_user_moderator_status(
@@ -727,17 +1263,20 @@ class Database:
             results = await self.users_collection.update(
                 {"_key": user_id, "is_moderator": is_moderator}
             )
+            self._evict_user(user_id)
 
             if not results or results.get("error"):
                 logger.error(
-                    f"Error updating moderator status for user {user_id}: {results.get('errorMessage', 'Unknown error')}"
+                    "Error updating moderator status for user %s: %s",
+                    user_id,
+                    results.get("errorMessage", "Unknown error"),
                 )
                 return False
 
-            logger.info(f"Updated user {user_id} moderator status to {is_moderator}")
+            logger.info("Updated user %s moderator status to %s", user_id, is_moderator)
             return True
         except Exception as e:
-            logger.error(f"Error updating moderator status: {e}")
+            logger.error("Error updating moderator status: %s", e)
             return False
 
     async def update_user_admin_status(self, user_id: str, is_admin: bool) -> bool:
@@ -746,17 +1285,20 @@ class Database:
             results = await self.users_collection.update(
                 {"_key": user_id, "is_admin": is_admin}
             )
+            self._evict_user(user_id)
 
             if not results or results.get("error"):
                 logger.error(
-                    f"Error updating admin status for user {user_id}: {results.get('errorMessage', 'Unknown error')}"
+                    "Error updating admin status for user %s: %s",
+                    user_id,
+                    results.get("errorMessage", "Unknown error"),
                 )
                 return False
 
-            logger.info(f"Updated user {user_id} admin status to {is_admin}")
+            logger.info("Updated user %s admin status to %s", user_id, is_admin)
             return True
         except Exception as e:
-            logger.error(f"Error updating admin status: {e}")
+            logger.error("Error updating admin status: %s", e)
             return False
 
     async def update_user_uploader_status(
@@ -767,31 +1309,33 @@ class Database:
             results = await self.users_collection.update(
                 {"_key": user_id, "is_uploader": is_uploader}
             )
+            self._evict_user(user_id)
             if not results or results.get("error"):
                 logger.error(
-                    f"Error updating uploader status for user {user_id}: {results.get('errorMessage', 'Unknown error')}"
+                    "Error updating uploader status for user %s: %s",
+                    user_id,
+                    results.get("errorMessage", "Unknown error"),
                 )
                 return False
 
-            logger.info(f"Updated user {user_id} uploader status to {is_uploader}")
+            logger.info("Updated user %s uploader status to %s", user_id, is_uploader)
             return True
         except Exception as e:
-            logger.error(f"Error updating uploader status: {e}")
+            logger.error("Error updating uploader status: %s", e)
             return False
 
-    async def get_all_users(self) -> List[Dict[str, Any]]:
-        """Get all users"""
+    async def get_all_users(self, include_secrets: bool = True) -> List[Dict[str, Any]]:
+        """Get all users, optionally without password hashes and TOTP secrets"""
         try:
+            query = USER_LIST_QUERY if include_secrets else PUBLIC_USER_LIST_QUERY
             cursor = await self.db.aql.execute(
-                "FOR doc IN users SORT doc.created_at DESC RETURN doc"
+                query,
+                batch_size=LARGE_BATCH_SIZE,
+                options={"stream": True},
             )
-            users = []
-            async with cursor:
-                async for doc in cursor:
-                    users.append(doc)
-            return users
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching all users: {e}")
+            logger.error("Error fetching all users: %s", e)
             return []
 
     # API Key management methods
@@ -799,28 +1343,36 @@ class Database:
         """Create a new API key"""
         try:
             if "created_at" not in api_key_data:
-                api_key_data["created_at"] = datetime.utcnow().isoformat()
+                api_key_data["created_at"] = now_iso()
 
-            result = await self.api_keys_collection.insert(api_key_data)
-            logger.info(f"Created API key with key: {result['_key']}")
-            return result["_key"]
+            key = await _insert_silent(self.api_keys_collection, api_key_data)
+            logger.info("Created API key with key: %s", key)
+            return key
         except Exception as e:
-            logger.error(f"Error creating API key: {e}")
+            logger.error("Error creating API key: %s", e)
             return None
 
     async def get_api_key_by_hash(self, key_hash: str) -> Optional[Dict[str, Any]]:
-        """Get an API key by its hash"""
+        """Get an active API key by its hash"""
+        hit = self._api_key_cache.get(key_hash)
+        if hit is not None:
+            if time.monotonic() - hit[0] < API_KEY_CACHE_TTL:
+                self._api_key_cache.move_to_end(key_hash)
+                return hit[1]
+            del self._api_key_cache[key_hash]
+
         try:
-            cursor = await self.db.aql.execute(
-                "FOR doc IN api_keys FILTER doc.key_hash == @key_hash AND doc.is_active == true LIMIT 1 RETURN doc",
-                bind_vars={"key_hash": key_hash},
+            cursor = await self.api_keys_collection.find(
+                {"key_hash": key_hash, "is_active": True}, limit=1
             )
-            async with cursor:
-                async for doc in cursor:
-                    return doc
-            return None
+            doc = _first(cursor)
+            if doc is not None:
+                self._api_key_cache[key_hash] = (time.monotonic(), doc)
+                while len(self._api_key_cache) > API_KEY_CACHE_SIZE:
+                    self._api_key_cache.popitem(last=False)
+            return doc
         except Exception as e:
-            logger.error(f"Error fetching API key: {e}")
+            logger.error("Error fetching API key: %s", e)
             return None
 
     async def get_user_api_keys(self, user_id: str) -> List[Dict[str, Any]]:
@@ -830,32 +1382,36 @@ class Database:
                 "FOR doc IN api_keys FILTER doc.user_id == @user_id SORT doc.created_at DESC RETURN doc",
                 bind_vars={"user_id": user_id},
             )
-            api_keys = []
-            async with cursor:
-                async for doc in cursor:
-                    api_keys.append(doc)
-            return api_keys
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching user API keys: {e}")
+            logger.error("Error fetching user API keys: %s", e)
             return []
 
     async def get_all_api_keys(self) -> List[Dict[str, Any]]:
         """Get all API keys (admin)"""
         try:
             cursor = await self.db.aql.execute(
-                "FOR doc IN api_keys SORT doc.created_at DESC RETURN doc"
+                "FOR doc IN api_keys SORT doc.created_at DESC RETURN doc",
+                batch_size=LARGE_BATCH_SIZE,
             )
-            api_keys = []
-            async with cursor:
-                async for doc in cursor:
-                    api_keys.append(doc)
-            return api_keys
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching all API keys: {e}")
+            logger.error("Error fetching all API keys: %s", e)
             return []
 
+    def _evict_api_key(self, key_id: str):
+        """Drop a cached API key so the next request sees its current state"""
+        stale = [
+            key_hash
+            for key_hash, (_, doc) in self._api_key_cache.items()
+            if doc.get("_key") == key_id
+        ]
+        for key_hash in stale:
+            del self._api_key_cache[key_hash]
+
     async def revoke_api_key(self, key_id: str) -> bool:
         """Revoke (deactivate) an API key"""
+        self._evict_api_key(key_id)
         try:
             results = await self.api_keys_collection.update(
                 {"_key": key_id, "is_active": False}
@@ -863,70 +1419,87 @@ class Database:
 
             if not results or results.get("error"):
                 logger.error(
-                    f"Error revoking API key {key_id}: {results.get('errorMessage', 'Unknown error')}"
+                    "Error revoking API key %s: %s",
+                    key_id,
+                    results.get("errorMessage", "Unknown error"),
                 )
                 return False
 
-            logger.info(f"Revoked API key: {key_id}")
+            # Drop any copy a concurrent lookup cached while the update was in flight
+            self._evict_api_key(key_id)
+            logger.info("Revoked API key: %s", key_id)
             return True
         except Exception as e:
-            logger.error(f"Error revoking API key: {e}")
+            logger.error("Error revoking API key: %s", e)
             return False
 
     async def update_api_key_last_used(self, key_id: str) -> bool:
-        """Update the last used timestamp for an API key"""
+        """Queue a last used timestamp update for an API key"""
+        # Repeated use of a key before the next flush collapses to one update
+        self._api_key_last_used[key_id] = now_iso()
+        self._schedule_flush(len(self._api_key_last_used))
+        return True
+
+    async def _flush_api_key_last_used(self):
+        """Write all queued API key last used timestamps in one query"""
+        if not self._api_key_last_used:
+            return
+        pending, self._api_key_last_used = self._api_key_last_used, {}
         try:
-            results = await self.api_keys_collection.update(
-                {
-                    "_key": key_id,
-                    "last_used_at": datetime.now(datetime.timezone.utc).isoformat(),
-                }
+            await self.db.aql.execute(
+                API_KEY_LAST_USED_QUERY,
+                bind_vars={
+                    "updates": [
+                        {"key": key, "last_used_at": ts} for key, ts in pending.items()
+                    ]
+                },
             )
-            if not results or results.get("error"):
-                logger.error(
-                    f"Error updating API key last used {key_id}: {results.get('errorMessage', 'Unknown error')}"
-                )
-                return False
-            return True
+            logger.debug("Updated last used time for %s API keys", len(pending))
         except Exception as e:
-            logger.error(f"Error updating API key last used: {e}")
-            return False
+            logger.error("Error updating API key last used: %s", e)
+            # Newer timestamps queued since the failed write take precedence
+            self._api_key_last_used = {**pending, **self._api_key_last_used}
 
     async def log_api_usage(self, usage_data: Dict[str, Any]) -> Optional[str]:
-        """Log API usage"""
-        try:
-            if "timestamp" not in usage_data:
-                usage_data["timestamp"] = datetime.now(
-                    datetime.timezone.utc
-                ).isoformat()
-
-            result = await self.api_usage_collection.insert(usage_data)
-            if not result or result.get("error"):
+        """Queue an API usage record, returning the key it will be stored under"""
+        if "timestamp" not in usage_data:
+            usage_data["timestamp"] = now_iso()
+        key = usage_data["_key"] = uuid.uuid4().hex
+        self._api_usage_buffer.append(usage_data)
+        self._schedule_flush(len(self._api_usage_buffer))
+        return key
+
+    async def _flush_api_usage(self):
+        """Insert all buffered API usage records in one request"""
+        if not self._api_usage_buffer:
+            return
+        batch, self._api_usage_buffer = self._api_usage_buffer, []
+        try:
+            errors = await self.api_usage_collection.insert_many(batch, silent=True)
+            for error in errors:
                 logger.error(
-                    f"Error logging API usage: {result.get('errorMessage', 'Unknown error')}"
+                    "Error logging API usage: %s",
+                    error.get("errorMessage", "Unknown error"),
                 )
-                return None
-            return result["_key"]
+            logger.debug("Flushed %s API usage records", len(batch) - len(errors))
         except Exception as e:
-            logger.error(f"Error logging API usage: {e}")
-            return None
+            logger.error("Error logging API usage: %s", e)
+            self._api_usage_buffer = _requeue(
+                batch, self._api_usage_buffer, "API usage"
+            )
 
     async def get_api_usage_by_key(
         self, key_id: str, limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get API usage logs for a specific key"""
         try:
-            cursor = await self.db.aql.execute(
+            cursor = await self._execute(
                 "FOR doc IN api_usage FILTER doc.api_key_id == @key_id SORT doc.timestamp DESC LIMIT @limit RETURN doc",
                 bind_vars={"key_id": key_id, "limit": limit},
             )
-            usage = []
-            async with cursor:
-                async for doc in cursor:
-                    usage.append(doc)
-            return usage
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching API usage: {e}")
+            logger.error("Error fetching API usage: %s", e)
             return []
 
     async def get_api_usage_by_user(
@@ -934,45 +1507,35 @@ class Database:
     ) -> List[Dict[str, Any]]:
         """Get API usage logs for a specific user"""
         try:
-            cursor = await self.db.aql.execute(
+            cursor = await self._execute(
                 "FOR doc IN api_usage FILTER doc.user_id == @user_id SORT doc.timestamp DESC LIMIT @limit RETURN doc",
                 bind_vars={"user_id": user_id, "limit": limit},
             )
-            usage = []
-            async with cursor:
-                async for doc in cursor:
-                    usage.append(doc)
-            return usage
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching API usage by user: {e}")
+            logger.error("Error fetching API usage by user: %s", e)
             return []
 
     async def get_api_usage_stats_by_user(self, user_id: str) -> Dict[str, Any]:
         """Get API usage statistics for a user"""
         try:
             # Get total count
-            cursor = await self.db.aql.execute(
+            cursor = await self._execute(
                 "FOR doc IN api_usage FILTER doc.user_id == @user_id COLLECT WITH COUNT INTO length RETURN length",
                 bind_vars={"user_id": user_id},
             )
-            total_calls = 0
-            async with cursor:
-                async for count in cursor:
-                    total_calls = count
+            total_calls = _first(cursor, 0)
 
             # Get count by endpoint
-            cursor = await self.db.aql.execute(
+            cursor = await self._execute(
                 "FOR doc IN api_usage FILTER doc.user_id == @user_id COLLECT endpoint = doc.endpoint WITH COUNT INTO count RETURN {endpoint, count}",
                 bind_vars={"user_id": user_id},
             )
-            by_endpoint = []
-            async with cursor:
-                async for item in cursor:
-                    by_endpoint.append(item)
+            by_endpoint = await _collect(cursor)
 
             return {"total_calls": total_calls, "by_endpoint": by_endpoint}
         except Exception as e:
-            logger.error(f"Error fetching API usage stats: {e}")
+            logger.error("Error fetching API usage stats: %s", e)
             return {"total_calls": 0, "by_endpoint": []}
 
     # Audit log methods
@@ -980,15 +1543,17 @@ class Database:
         """Add an audit log entry"""
         try:
             if "timestamp" not in log_data:
-                log_data["timestamp"] = datetime.utcnow().isoformat()
+                log_data["timestamp"] = now_iso()
 
-            result = await self.audit_logs_collection.insert(log_data)
-            logger.info(
-                f"Added audit log: {log_data['action']} by {log_data.get('actor_username', 'unknown')}"
+            key = await _insert_silent(self.audit_logs_collection, log_data)
+            logger.debug(
+                "Added audit log: %s by %s",
+                log_data["action"],
+                log_data.get("actor_username", "unknown"),
             )
-            return result["_key"]
+            return key
         except Exception as e:
-            logger.error(f"Error adding audit log: {e}")
+            logger.error("Error adding audit log: %s", e)
             return None
 
     async def get_audit_logs(
@@ -1021,51 +1586,43 @@ class Database:
 
             query += " SORT doc.timestamp DESC LIMIT @limit RETURN doc"
 
-            cursor = await self.db.aql.execute(query, bind_vars=bind_vars)
-            logs = []
-            async with cursor:
-                async for doc in cursor:
-                    logs.append(doc)
-            return logs
+            cursor = await self._execute(query, bind_vars=bind_vars)
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching audit logs: {e}")
+            logger.error("Error fetching audit logs: %s", e)
             return []
 
     async def get_audit_log_stats(self) -> Dict[str, Any]:
         """Get audit log statistics"""
         try:
-            # Total count
-            cursor = await self.db.aql.execute("RETURN LENGTH(audit_logs)")
-            total_count = 0
-            async with cursor:
-                async for count in cursor:
-                    total_count = count
-
-            # Count by action
-            cursor = await self.db.aql.execute(
-                "FOR doc IN audit_logs COLLECT action = doc.action WITH COUNT INTO count RETURN {action, count}"
-            )
-            by_action = []
-            async with cursor:
-                async for item in cursor:
-                    by_action.append(item)
-
-            return {"total_logs": total_count, "by_action": by_action}
+            return await self._cached_stats("audit_logs", self._audit_log_stats)
         except Exception as e:
-            logger.error(f"Error fetching audit log stats: {e}")
+            logger.error("Error fetching audit log stats: %s", e)
             return {"total_logs": 0, "by_action": []}
 
+    async def _audit_log_stats(self) -> Dict[str, Any]:
+        """Compute audit log statistics"""
+        # Total count
+        total_count = await self.audit_logs_collection.count()
+
+        # Count by action
+        cursor = await self.db.aql.execute(
+            "FOR doc IN audit_logs COLLECT action = doc.action WITH COUNT INTO count RETURN {action, count}"
+        )
+        by_action = await _collect(cursor)
+
+        return {"total_logs": total_count, "by_action": by_action}
+
     # Activity log methods
     async def add_activity_log(self, log_data: Dict[str, Any]) -> Optional[str]:
         """Add an activity log entry"""
         try:
             if "timestamp" not in log_data:
-                log_data["timestamp"] = datetime.utcnow().isoformat()
+                log_data["timestamp"] = now_iso()
 
-            result = await self.activity_logs_collection.insert(log_data)
-            return result["_key"]
+            return await _insert_silent(self.activity_logs_collection, log_data)
         except Exception as e:
-            logger.error(f"Error adding activity log: {e}")
+            logger.error("Error adding activity log: %s", e)
             return None
 
     async def get_activity_logs(
@@ -1093,40 +1650,33 @@ class Database:
 
             query += " SORT doc.timestamp DESC LIMIT @limit RETURN doc"
 
-            cursor = await self.db.aql.execute(query, bind_vars=bind_vars)
-            logs = []
-            async with cursor:
-                async for doc in cursor:
-                    logs.append(doc)
-            return logs
+            cursor = await self._execute(query, bind_vars=bind_vars)
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching activity logs: {e}")
+            logger.error("Error fetching activity logs: %s", e)
             return []
 
     async def get_activity_log_stats(self) -> Dict[str, Any]:
         """Get activity log statistics"""
         try:
-            # Total count
-            cursor = await self.db.aql.execute("RETURN LENGTH(activity_logs)")
-            total_count = 0
-            async with cursor:
-                async for count in cursor:
-                    total_count = count
-
-            # Count by event type
-            cursor = await self.db.aql.execute(
-                "FOR doc IN activity_logs COLLECT event_type = doc.event_type WITH COUNT INTO count RETURN {event_type, count}"
-            )
-            by_event_type = []
-            async with cursor:
-                async for item in cursor:
-                    by_event_type.append(item)
-
-            return {"total_logs": total_count, "by_event_type": by_event_type}
+            return await self._cached_stats("activity_logs", self._activity_log_stats)
         except Exception as e:
-            logger.error(f"Error fetching activity log stats: {e}")
+            logger.error("Error fetching activity log stats: %s", e)
             return {"total_logs": 0, "by_event_type": []}
 
+    async def _activity_log_stats(self) -> Dict[str, Any]:
+        """Compute activity log statistics"""
+        # Total count
+        total_count = await self.activity_logs_collection.count()
+
+        # Count by event type
+        cursor = await self.db.aql.execute(
+            "FOR doc IN activity_logs COLLECT event_type = doc.event_type WITH COUNT INTO count RETURN {event_type, count}"
+        )
+        by_event_type = await _collect(cursor)
+
+        return {"total_logs": total_count, "by_event_type": by_event_type}
+
     # Upload statistics methods
     async def record_upload(
         self, user_id: str, username: str, entry_id: str, size_bytes: int
@@ -1138,13 +1688,13 @@ class Database:
                 "username": username,
                 "entry_id": entry_id,
                 "size_bytes": size_bytes,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
             }
-            result = await self.upload_statistics_collection.insert(upload_data)
-            logger.info(f"Recorded upload by {username}: {size_bytes} bytes")
-            return result["_key"]
+            key = await _insert_silent(self.upload_statistics_collection, upload_data)
+            logger.debug("Recorded upload by %s: %s bytes", username, size_bytes)
+            return key
         except Exception as e:
-            logger.error(f"Error recording upload: {e}")
+            logger.error("Error recording upload: %s", e)
             return None
 
     async def get_upload_statistics(
@@ -1153,117 +1703,135 @@ class Database:
         """Get upload statistics for a user or all users"""
         try:
             if user_id:
-                # Get stats for specific user
-                query = """
-                FOR doc IN upload_statistics
-                FILTER doc.user_id == @user_id
-                COLLECT AGGREGATE
-                    total_uploads = COUNT(1),
-                    total_bytes = SUM(doc.size_bytes)
-                RETURN {total_uploads, total_bytes}
-                """
-                bind_vars = {"user_id": user_id}
-            else:
-                # Get overall stats
-                query = """
-                FOR doc IN upload_statistics
-                COLLECT AGGREGATE
-                    total_uploads = COUNT(1),
-                    total_bytes = SUM(doc.size_bytes)
-                RETURN {total_uploads, total_bytes}
-                """
-                bind_vars = {}
-
-            cursor = await self.db.aql.execute(query, bind_vars=bind_vars)
-            async with cursor:
-                async for result in cursor:
-                    total_gb = (result.get("total_bytes", 0) or 0) / BYTES_PER_GB
-                    return {
-                        "total_uploads": result.get("total_uploads", 0) or 0,
-                        "total_bytes": result.get("total_bytes", 0) or 0,
-                        "total_gb": round(total_gb, 2),
-                    }
-            return {"total_uploads": 0, "total_bytes": 0, "total_gb": 0}
+                return await self._upload_statistics(user_id)
+            return await self._cached_stats("uploads", self._upload_statistics)
         except Exception as e:
-            logger.error(f"Error fetching upload statistics: {e}")
+            logger.error("Error fetching upload statistics: %s", e)
             return {"total_uploads": 0, "total_bytes": 0, "total_gb": 0}
 
-    async def get_all_uploader_statistics(self) -> List[Dict[str, Any]]:
-        """Get upload statistics for all uploaders"""
-        try:
+    async def _upload_statistics(self, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """Compute upload statistics for a user or all users"""
+        if user_id:
+            # Get stats for specific user
             query = """
             FOR doc IN upload_statistics
-            COLLECT user_id = doc.user_id, username = doc.username
-            AGGREGATE
+            FILTER doc.user_id == @user_id
+            COLLECT AGGREGATE
                 total_uploads = COUNT(1),
                 total_bytes = SUM(doc.size_bytes)
-            SORT total_bytes DESC
-            RETURN {
-                user_id,
-                username,
-                total_uploads,
-                total_bytes
-            }
+            RETURN {total_uploads, total_bytes}
             """
-            cursor = await self.db.aql.execute(query)
-            stats = []
-            async with cursor:
-                async for doc in cursor:
-                    # Calculate total_gb in Python instead of AQL
-                    total_bytes = doc.get("total_bytes", 0) or 0
-                    doc["total_gb"] = round(total_bytes / BYTES_PER_GB, 2)
-                    stats.append(doc)
-            return stats
+            bind_vars = {"user_id": user_id}
+        else:
+            # Get overall stats
+            query = """
+            FOR doc IN upload_statistics
+            COLLECT AGGREGATE
+                total_uploads = COUNT(1),
+                total_bytes = SUM(doc.size_bytes)
+            RETURN {total_uploads, total_bytes}
+            """
+            bind_vars = {}
+
+        cursor = await self._execute(query, bind_vars=bind_vars)
+        result = _first(cursor)
+        if result:
+            total_gb = (result.get("total_bytes", 0) or 0) / BYTES_PER_GB
+            return {
+                "total_uploads": result.get("total_uploads", 0) or 0,
+                "total_bytes": result.get("total_bytes", 0) or 0,
+                "total_gb": round(total_gb, 2),
+            }
+        return {"total_uploads": 0, "total_bytes": 0, "total_gb": 0}
+
+    async def get_all_uploader_statistics(self) -> List[Dict[str, Any]]:
+        """Get upload statistics for all uploaders"""
+        try:
+            return await self._cached_stats("uploaders", self._all_uploader_statistics)
         except Exception as e:
-            logger.error(f"Error fetching all uploader statistics: {e}")
+            logger.error("Error fetching all uploader statistics: %s", e)
             return []
 
+    async def _all_uploader_statistics(self) -> List[Dict[str, Any]]:
+        """Compute upload statistics for all uploaders"""
+        query = """
+        FOR doc IN upload_statistics
+        COLLECT user_id = doc.user_id, username = doc.username
+        AGGREGATE
+            total_uploads = COUNT(1),
+            total_bytes = SUM(doc.size_bytes)
+        SORT total_bytes DESC
+        RETURN {
+            user_id,
+            username,
+            total_uploads,
+            total_bytes
+        }
+        """
+        cursor = await self.db.aql.execute(query, batch_size=LARGE_BATCH_SIZE)
+        stats = await _collect(cursor)
+        for doc in stats:
+            # Calculate total_gb in Python instead of AQL
+            total_bytes = doc.get("total_bytes", 0) or 0
+            doc["total_gb"] = round(total_bytes / BYTES_PER_GB, 2)
+        return stats
+
     async def get_download_statistics(
         self, user_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get download statistics for a user or all users"""
         try:
             if user_id:
-                # Get stats for specific user
-                query = """
-                FOR doc IN download_history
-                FILTER doc.user_id == @user_id
-                COLLECT AGGREGATE
-                    total_downloads = COUNT(1),
-                    total_bytes = SUM(doc.size_bytes)
-                RETURN {total_downloads, total_bytes}
-                """
-                bind_vars = {"user_id": user_id}
-            else:
-                # Get overall stats
-                query = """
-                FOR doc IN download_history
-                COLLECT AGGREGATE
-                    total_downloads = COUNT(1),
-                    total_bytes = SUM(doc.size_bytes)
-                RETURN {total_downloads, total_bytes}
-                """
-                bind_vars = {}
-
-            cursor = await self.db.aql.execute(query, bind_vars=bind_vars)
-            async with cursor:
-                async for result in cursor:
-                    total_gb = (result.get("total_bytes", 0) or 0) / BYTES_PER_GB
-                    return {
-                        "total_downloads": result.get("total_downloads", 0) or 0,
-                        "total_bytes": result.get("total_bytes", 0) or 0,
-                        "total_gb": round(total_gb, 2),
-                    }
-            return {"total_downloads": 0, "total_bytes": 0, "total_gb": 0}
+                return await self._download_statistics(user_id)
+            return await self._cached_stats("downloads", self._download_statistics)
         except Exception as e:
-            logger.error(f"Error fetching download statistics: {e}")
+            logger.error("Error fetching download statistics: %s", e)
             return {"total_downloads": 0, "total_bytes": 0, "total_gb": 0}
 
+    async def _download_statistics(
+        self, user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Compute download statistics for a user or all users"""
+        if user_id:
+            # Get stats for specific user
+            query = """
+            FOR doc IN download_history
+            FILTER doc.user_id == @user_id
+            COLLECT AGGREGATE
+                total_downloads = COUNT(1),
+                total_bytes = SUM(doc.size_bytes)
+            RETURN {total_downloads, total_bytes}
+            """
+            bind_vars = {"user_id": user_id}
+        else:
+            # Get overall stats
+            query = """
+            FOR doc IN download_history
+            COLLECT AGGREGATE
+                total_downloads = COUNT(1),
+                total_bytes = SUM(doc.size_bytes)
+            RETURN {total_downloads, total_bytes}
+            """
+            bind_vars = {}
+
+        cursor = await self._execute(query, bind_vars=bind_vars)
+        result = _first(cursor)
+        if result:
+            total_gb = (result.get("total_bytes", 0) or 0) / BYTES_PER_GB
+            return {
+                "total_downloads": result.get("total_downloads", 0) or 0,
+                "total_bytes": result.get("total_bytes", 0) or 0,
+                "total_gb": round(total_gb, 2),
+            }
+        return {"total_downloads": 0, "total_bytes": 0, "total_gb": 0}
+
     async def get_user_statistics(self, user_id: str) -> Dict[str, Any]:
         """Get comprehensive statistics for a specific user"""
         try:
-            upload_stats = await self.get_upload_statistics(user_id)
-            download_stats = await self.get_download_statistics(user_id)
+            upload_stats, download_stats = await asyncio.gather(
+                self.get_upload_statistics(user_id),
+                self.get_download_statistics(user_id),
+            )
 
             # Calculate ratio (uploaded / downloaded)
             total_uploaded_bytes = upload_stats.get("total_bytes", 0)
@@ -1284,7 +1852,7 @@ class Database:
                 "ratio": round(ratio, 2) if ratio != float("inf") else "∞",
             }
         except Exception as e:
-            logger.error(f"Error fetching user statistics: {e}")
+            logger.error("Error fetching user statistics: %s", e)
             return {
                 "total_uploaded": 0,
                 "total_uploaded_bytes": 0,
@@ -1304,13 +1872,10 @@ class Database:
             COLLECT WITH COUNT INTO count
             RETURN count
             """
-            cursor = await self.db.aql.execute(query, bind_vars={"entry_id": entry_id})
-            async with cursor:
-                async for count in cursor:
-                    return count or 0
-            return 0
+            cursor = await self._execute(query, bind_vars={"entry_id": entry_id})
+            return _first(cursor) or 0
         except Exception as e:
-            logger.error(f"Error fetching entry download count: {e}")
+            logger.error("Error fetching entry download count: %s", e)
             return 0
 
     async def get_all_entries_with_download_counts(
@@ -1335,73 +1900,53 @@ class Database:
             )
 
             if search_query:
-                # Search with download counts, report counts, and vote stats
-                # Normalize both entry name and search term by replacing underscores with spaces for search
-                query = f"""
-                FOR entry IN entries
-                FILTER LOWER(SUBSTITUTE(entry.name, '_', ' ')) LIKE LOWER(SUBSTITUTE(CONCAT('%', @search, '%'), '_', ' ')){corrupt_filter}
-                LET download_count = (
-                    FOR doc IN download_history
-                    FILTER doc.entry_id == entry._key
-                    COLLECT WITH COUNT INTO count
-                    RETURN count
-                )[0] || 0
-                LET report_count = (
-                    FOR report IN reports
-                    FILTER report.entry_id == entry._key AND report.status == 'open'
-                    COLLECT WITH COUNT INTO count
-                    RETURN count
-                )[0] || 0
-                LET vote_stats = (
-                    FOR vote IN likes
-                    FILTER vote.entry_id == entry._key
-                    COLLECT vote_type = vote.vote_type WITH COUNT INTO count
-                    RETURN {{vote_type: vote_type, count: count}}
+                # Names match with underscores read as spaces, ignoring case; the
+                # search term is normalized once here instead of per document
+                search_filter = (
+                    " AND CONTAINS(LOWER(SUBSTITUTE(entry.name, '_', ' ')), @search)"
                 )
-                LET likes_count = FIRST(FOR v IN vote_stats FILTER v.vote_type == 'like' RETURN v.count) || 0
-                LET dislikes_count = FIRST(FOR v IN vote_stats FILTER v.vote_type == 'dislike' RETURN v.count) || 0
-                LET comment_count = (
-                    FOR comment IN comments
-                    FILTER comment.entry_id == entry._key
-                    COLLECT WITH COUNT INTO count
-                    RETURN count
-                )[0] || 0
-                """
-                bind_vars = {"search": search_query}
+                bind_vars = {"search": search_query.replace("_", " ").lower()}
             else:
-                # Get all entries with download counts, report counts, and vote stats
-                query = f"""
-                FOR entry IN entries
-                FILTER true{corrupt_filter}
-                LET download_count = (
-                    FOR doc IN download_history
-                    FILTER doc.entry_id == entry._key
-                    COLLECT WITH COUNT INTO count
-                    RETURN count
-                )[0] || 0
-                LET report_count = (
-                    FOR report IN reports
-                    FILTER report.entry_id == entry._key AND report.status == 'open'
-                    COLLECT WITH COUNT INTO count
-                    RETURN count
-                )[0] || 0
-                LET vote_stats = (
-                    FOR vote IN likes
-                    FILTER vote.entry_id == entry._key
-                    COLLECT vote_type = vote.vote_type WITH COUNT INTO count
-                    RETURN {{vote_type: vote_type, count: count}}
-                )
-                LET likes_count = FIRST(FOR v IN vote_stats FILTER v.vote_type == 'like' RETURN v.count) || 0
-                LET dislikes_count = FIRST(FOR v IN vote_stats FILTER v.vote_type == 'dislike' RETURN v.count) || 0
-                LET comment_count = (
-                    FOR comment IN comments
-                    FILTER comment.entry_id == entry._key
-                    COLLECT WITH COUNT INTO count
-                    RETURN count
-                )[0] || 0
-                """
+                search_filter = ""
                 bind_vars = {}
 
+            # Count only for the entries that pass the filters; each count is an
+            # index-only lookup on the entry_id indexes in INDEXES
+            query = f"""
+            FOR entry IN entries
+            FILTER true{corrupt_filter}{search_filter}
+            LET download_count = FIRST(
+                FOR doc IN download_history
+                FILTER doc.entry_id == entry._key
+                COLLECT WITH COUNT INTO count
+                RETURN count
+            )
+            LET report_count = FIRST(
+                FOR report IN reports
+                FILTER report.entry_id == entry._key AND report.status == 'open'
+                COLLECT WITH COUNT INTO count
+                RETURN count
+            )
+            LET likes_count = FIRST(
+                FOR vote IN likes
+                FILTER vote.entry_id == entry._key AND vote.vote_type == 'like'
+                COLLECT WITH COUNT INTO count
+                RETURN count
+            )
+            LET dislikes_count = FIRST(
+                FOR vote IN likes
+                FILTER vote.entry_id == entry._key AND vote.vote_type == 'dislike'
+                COLLECT WITH COUNT INTO count
+                RETURN count
+            )
+            LET comment_count = FIRST(
+                FOR comment IN comments
+                FILTER comment.entry_id == entry._key
+                COLLECT WITH COUNT INTO count
+                RETURN count
+            )
+            """
+
             # Add sorting
             if sort_by == "downloads":
                 query += " SORT download_count DESC"
@@ -1420,14 +1965,12 @@ class Database:
 
             query += " RETURN MERGE(entry, {download_count: download_count, report_count: report_count, likes_count: likes_count, dislikes_count: dislikes_count, comment_count: comment_count})"
 
-            cursor = await self.db.aql.execute(query, bind_vars=bind_vars)
-            entries = []
-            async with cursor:
-                async for entry in cursor:
-                    entries.append(entry)
-            return entries
+            cursor = await self._execute(
+                query, bind_vars=bind_vars, batch_size=LARGE_BATCH_SIZE
+            )
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching entries with download counts: {e}")
+            logger.error("Error fetching entries with download counts: %s", e)
             return []
 
     # Report management methods
@@ -1450,13 +1993,12 @@ class Database:
                 "reason": reason,
                 "description": description,
                 "status": "open",  # open, resolved
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": now_iso(),
                 "resolved_at": None,
                 "resolved_by": None,
                 "resolved_by_username": None,
             }
-            result = await self.reports_collection.insert(report_data)
-            report_id = result["_key"]
+            report_id = await _insert_silent(self.reports_collection, report_data)
 
             # Add report to entry's reports array
             report_entry_data = {
@@ -1481,10 +2023,10 @@ class Database:
                 bind_vars={"entry_id": entry_id, "report_data": report_entry_data},
             )
 
-            logger.info(f"Created report for entry {entry_id} by user {username}")
+            logger.info("Created report for entry %s by user %s", entry_id, username)
             return report_id
         except Exception as e:
-            logger.error(f"Error creating report: {e}")
+            logger.error("Error creating report: %s", e)
             return None
 
     async def get_all_reports(
@@ -1524,14 +2066,12 @@ class Database:
                 """
                 bind_vars = {}
 
-            cursor = await self.db.aql.execute(query, bind_vars=bind_vars)
-            reports = []
-            async with cursor:
-                async for doc in cursor:
-                    reports.append(doc)
-            return reports
+            cursor = await self._execute(
+                query, bind_vars=bind_vars, batch_size=LARGE_BATCH_SIZE
+            )
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching reports: {e}")
+            logger.error("Error fetching reports: %s", e)
             return []
 
     async def get_report_count_for_entry(self, entry_id: str) -> int:
@@ -1543,13 +2083,10 @@ class Database:
             COLLECT WITH COUNT INTO count
             RETURN count
             """
-            cursor = await self.db.aql.execute(query, bind_vars={"entry_id": entry_id})
-            async with cursor:
-                async for count in cursor:
-                    return count or 0
-            return 0
+            cursor = await self._execute(query, bind_vars={"entry_id": entry_id})
+            return _first(cursor) or 0
         except Exception as e:
-            logger.error(f"Error fetching report count: {e}")
+            logger.error("Error fetching report count: %s", e)
             return 0
 
     async def resolve_report(
@@ -1561,156 +2098,137 @@ class Database:
                 {
                     "_key": report_id,
                     "status": "resolved",
-                    "resolved_at": datetime.utcnow().isoformat(),
+                    "resolved_at": now_iso(),
                     "resolved_by": resolved_by_id,
                     "resolved_by_username": resolved_by_username,
-                }
+                },
+                silent=True,
             )
-            logger.info(f"Resolved report {report_id} by {resolved_by_username}")
+            logger.info("Resolved report %s by %s", report_id, resolved_by_username)
             return True
         except Exception as e:
-            logger.error(f"Error resolving report: {e}")
+            logger.error("Error resolving report: %s", e)
             return False
 
     async def count_reports(self, status: Optional[str] = None) -> int:
         """Count reports, optionally filtered by status"""
         try:
-            if status:
-                query = """
-                FOR doc IN reports
-                FILTER doc.status == @status
-                COLLECT WITH COUNT INTO count
-                RETURN count
-                """
-                bind_vars = {"status": status}
-            else:
-                query = """
-                FOR doc IN reports
-                COLLECT WITH COUNT INTO count
-                RETURN count
-                """
-                bind_vars = {}
+            if not status:
+                return await self.reports_collection.count()
 
-            cursor = await self.db.aql.execute(query, bind_vars=bind_vars)
-            async with cursor:
-                async for count in cursor:
-                    return count or 0
-            return 0
+            query = """
+            FOR doc IN reports
+            FILTER doc.status == @status
+            COLLECT WITH COUNT INTO count
+            RETURN count
+            """
+            cursor = await self._execute(query, bind_vars={"status": status})
+            return _first(cursor) or 0
         except Exception as e:
-            logger.error(f"Error counting reports: {e}")
+            logger.error("Error counting reports: %s", e)
             return 0
 
     async def get_system_statistics(self) -> Dict[str, Any]:
         """Get system-wide statistics including directories, storage, and game count"""
         try:
-            # Get total game count
-            query = "RETURN LENGTH(entries)"
-            cursor = await self.db.aql.execute(query)
-            total_games = 0
-            async with cursor:
-                async for count in cursor:
-                    total_games = count
+            return await self._cached_stats("system", self._system_statistics)
+        except Exception as e:
+            logger.error("Error fetching system statistics: %s", e)
+            return {
+                "total_games": 0,
+                "total_size_gb": 0,
+                "total_available_gb": 0,
+                "total_capacity_gb": 0,
+                "directories": [],
+            }
 
-            # Get all directories
-            directories = await self.get_all_directories()
+    async def _system_statistics(self) -> Dict[str, Any]:
+        """Compute system-wide statistics"""
+        # Get total game count
+        total_games = await self.entries_collection.count()
 
-            # Fetch game counts and sizes for all directories at once
-            # This avoids N+1 query pattern
-            dir_paths = [d.get("path", "") for d in directories]
-            games_by_dir = {}
+        # Get all directories
+        directories = await self.get_all_directories()
 
-            if dir_paths:
-                # Single aggregation query to get counts and sizes per directory
-                query = """
-                FOR doc IN entries
-                FILTER doc.type == 'filepath'
-                LET matching_dir = (
-                    FOR path IN @paths
-                    FILTER STARTS_WITH(doc.source, path)
-                    LIMIT 1
-                    RETURN path
-                )[0]
-                FILTER matching_dir != null
-                COLLECT dir_path = matching_dir
-                AGGREGATE
-                    game_count = LENGTH(1),
-                    total_size = SUM(doc.size)
-                RETURN {
-                    dir_path,
-                    game_count,
-                    total_size
+        # Fetch game counts and sizes for all directories at once
+        # This avoids N+1 query pattern
+        dir_paths = [d.get("path", "") for d in directories]
+        games_by_dir = {}
+
+        if dir_paths:
+            # Single aggregation query to get counts and sizes per directory
+            query = """
+            FOR doc IN entries
+            FILTER doc.type == 'filepath'
+            LET matching_dir = (
+                FOR path IN @paths
+                FILTER STARTS_WITH(doc.source, path)
+                LIMIT 1
+                RETURN path
+            )[0]
+            FILTER matching_dir != null
+            COLLECT dir_path = matching_dir
+            AGGREGATE
+                game_count = LENGTH(1),
+                total_size = SUM(doc.size)
+            RETURN {
+                dir_path,
+                game_count,
+                total_size
+            }
+            """
+            cursor = await self.db.aql.execute(query, bind_vars={"paths": dir_paths})
+            for result in await _collect(cursor):
+                games_by_dir[result["dir_path"]] = {
+                    "game_count": result["game_count"] or 0,
+                    "total_size": result["total_size"] or 0,
                 }
-                """
-                cursor = await self.db.aql.execute(
-                    query, bind_vars={"paths": dir_paths}
-                )
-                async with cursor:
-                    async for result in cursor:
-                        games_by_dir[result["dir_path"]] = {
-                            "game_count": result["game_count"] or 0,
-                            "total_size": result["total_size"] or 0,
-                        }
 
-            # Calculate storage info for each directory
-            directory_stats = []
-            total_size_bytes = 0
-            total_available_bytes = 0
-            total_capacity_bytes = 0
+        # Calculate storage info for each directory
+        directory_stats = []
+        total_size_bytes = 0
+        total_available_bytes = 0
+        total_capacity_bytes = 0
+
+        for directory in directories:
+            dir_path = directory.get("path", "")
+            dir_info = games_by_dir.get(dir_path, {"game_count": 0, "total_size": 0})
+
+            dir_stat = {
+                "path": dir_path,
+                "exists": False,
+                "game_count": dir_info["game_count"],
+                "size_gb": round(dir_info["total_size"] / BYTES_PER_GB, 2),
+                "available_gb": 0,
+                "capacity_gb": 0,
+            }
 
-            for directory in directories:
-                dir_path = directory.get("path", "")
-                dir_info = games_by_dir.get(
-                    dir_path, {"game_count": 0, "total_size": 0}
-                )
+            if os.path.exists(dir_path):
+                try:
+                    # Get disk usage
+                    disk_usage = shutil.disk_usage(dir_path)
+                    dir_stat["exists"] = True
+                    dir_stat["available_gb"] = round(disk_usage.free / BYTES_PER_GB, 2)
+                    dir_stat["capacity_gb"] = round(disk_usage.total / BYTES_PER_GB, 2)
 
-                dir_stat = {
-                    "path": dir_path,
-                    "exists": False,
-                    "game_count": dir_info["game_count"],
-                    "size_gb": round(dir_info["total_size"] / BYTES_PER_GB, 2),
-                    "available_gb": 0,
-                    "capacity_gb": 0,
-                }
+                    total_available_bytes += disk_usage.free
+                    total_capacity_bytes += disk_usage.total
+                    total_size_bytes += dir_info["total_size"]
 
-                if os.path.exists(dir_path):
-                    try:
-                        # Get disk usage
-                        disk_usage = shutil.disk_usage(dir_path)
-                        dir_stat["exists"] = True
-                        dir_stat["available_gb"] = round(
-                            disk_usage.free / BYTES_PER_GB, 2
-                        )
-                        dir_stat["capacity_gb"] = round(
-                            disk_usage.total / BYTES_PER_GB, 2
-                        )
-
-                        total_available_bytes += disk_usage.free
-                        total_capacity_bytes += disk_usage.total
-                        total_size_bytes += dir_info["total_size"]
-
-                    except Exception as e:
-                        logger.error(
-                            f"Error getting stats for directory {dir_path}: {e}"
-                        )
-
-                directory_stats.append(dir_stat)
+                except Exception as e:
+                    logger.error(
+                        "Error getting stats for directory %s: %s", dir_path, e
+                    )
 
-            return {
-                "total_games": total_games,
-                "total_size_gb": round(total_size_bytes / BYTES_PER_GB, 2),
-                "total_available_gb": round(total_available_bytes / BYTES_PER_GB, 2),
-                "total_capacity_gb": round(total_capacity_bytes / BYTES_PER_GB, 2),
-                "directories": directory_stats,
-            }
-        except Exception as e:
-            logger.error(f"Error fetching system statistics: {e}")
-            return {
-                "total_games": 0,
-                "total_size_gb": 0,
-                "total_available_gb": 0,
-                "total_capacity_gb": 0,
-                "directories": [],
-            }
+            directory_stats.append(dir_stat)
+
+        return {
+            "total_games": total_games,
+            "total_size_gb": round(total_size_bytes / BYTES_PER_GB, 2),
+            "total_available_gb": round(total_available_bytes / BYTES_PER_GB, 2),
+            "total_capacity_gb": round(total_capacity_bytes / BYTES_PER_GB, 2),
+            "directories": directory_stats,
+        }
 
     # Comment management methods
     async def create_comment(
@@ -1729,12 +2247,11 @@ class Database:
                 "username": username,
                 "text": text,
                 "parent_comment_id": parent_comment_id,
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": now_iso(),
             }
-            result = await self.comments_collection.insert(comment_data)
-            return result["_key"]
+            return await _insert_silent(self.comments_collection, comment_data)
         except Exception as e:
-            logger.error(f"Error creating comment: {e}")
+            logger.error("Error creating comment: %s", e)
             return None
 
     async def get_comments_for_entry(
@@ -1786,25 +2303,37 @@ class Database:
                 user_vote: user_vote
             })
             """
-            cursor = await self.db.aql.execute(
+            cursor = await self._execute(
                 query, bind_vars={"entry_id": entry_id, "user_id": user_id}
             )
-            comments = []
-            async with cursor:
-                async for comment in cursor:
-                    comments.append(comment)
-            return comments
+            return await _collect(cursor)
         except Exception as e:
-            logger.error(f"Error fetching comments: {e}")
+            logger.error("Error fetching comments: %s", e)
             return []
 
+    async def get_comment_by_id(self, comment_id: str) -> Optional[Dict[str, Any]]:
+        """Get a comment by ID"""
+        if not comment_id:
+            return None
+        try:
+            return await self.comments_collection.get(comment_id)
+        except DocumentParseError:
+            return None
+        except Exception as e:
+            # Malformed keys come back as 400/404; treat them as a plain miss
+            if isinstance(e, DocumentGetError) and e.http_code in (400, 404):
+                logger.debug("Comment %s not found: %s", comment_id, e)
+            else:
+                logger.error("Error fetching comment by ID: %s", e)
+            return None
+
     async def delete_comment(self, comment_id: str) -> bool:
         """Delete a comment by ID"""
         try:
             await self.comments_collection.delete(comment_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting comment: {e}")
+            logger.error("Error deleting comment: %s", e)
             return False
 
     # Like/Dislike management methods
@@ -1822,11 +2351,7 @@ class Database:
             cursor = await self.db.aql.execute(
                 query, bind_vars={"entry_id": entry_id, "user_id": user_id}
             )
-            existing_vote = None
-            async with cursor:
-                async for vote in cursor:
-                    existing_vote = vote
-                    break
+            existing_vote = _first(cursor)
 
             if existing_vote:
                 # Update existing vote
@@ -1836,11 +2361,12 @@ class Database:
                 else:
                     # Different vote, update it
                     await self.likes_collection.update(
-                        existing_vote["_key"],
                         {
+                            "_key": existing_vote["_key"],
                             "vote_type": vote_type,
-                            "updated_at": datetime.utcnow().isoformat(),
+                            "updated_at": now_iso(),
                         },
+                        silent=True,
                     )
             else:
                 # Create new vote
@@ -1848,13 +2374,13 @@ class Database:
                     "entry_id": entry_id,
                     "user_id": user_id,
                     "vote_type": vote_type,
-                    "created_at": datetime.utcnow().isoformat(),
+                    "created_at": now_iso(),
                 }
-                await self.likes_collection.insert(vote_data)
+                await self.likes_collection.insert(vote_data, silent=True)
 
             return True
         except Exception as e:
-            logger.error(f"Error adding/updating vote: {e}")
+            logger.error("Error adding/updating vote: %s", e)
             return False
 
     async def get_vote_stats_for_entry(self, entry_id: str) -> Dict[str, int]:
@@ -1866,17 +2392,16 @@ class Database:
             COLLECT vote_type = vote.vote_type WITH COUNT INTO count
             RETURN {vote_type: vote_type, count: count}
             """
-            cursor = await self.db.aql.execute(query, bind_vars={"entry_id": entry_id})
+            cursor = await self._execute(query, bind_vars={"entry_id": entry_id})
             stats = {"likes": 0, "dislikes": 0}
-            async with cursor:
-                async for stat in cursor:
-                    if stat["vote_type"] == "like":
-                        stats["likes"] = stat["count"]
-                    elif stat["vote_type"] == "dislike":
-                        stats["dislikes"] = stat["count"]
+            for stat in await _collect(cursor):
+                if stat["vote_type"] == "like":
+                    stats["likes"] = stat["count"]
+                elif stat["vote_type"] == "dislike":
+                    stats["dislikes"] = stat["count"]
             return stats
         except Exception as e:
-            logger.error(f"Error fetching vote stats: {e}")
+            logger.error("Error fetching vote stats: %s", e)
             return {"likes": 0, "dislikes": 0}
 
     async def get_user_vote_for_entry(
@@ -1887,17 +2412,15 @@ class Database:
             query = """
             FOR vote IN likes
             FILTER vote.entry_id == @entry_id AND vote.user_id == @user_id
+            LIMIT 1
             RETURN vote.vote_type
             """
-            cursor = await self.db.aql.execute(
+            cursor = await self._execute(
                 query, bind_vars={"entry_id": entry_id, "user_id": user_id}
             )
-            async with cursor:
-                async for vote_type in cursor:
-                    return vote_type
-            return None
+            return _first(cursor)
         except Exception as e:
-            logger.error(f"Error fetching user vote: {e}")
+            logger.error("Error fetching user vote: %s", e)
             return None
 
     async def add_or_update_comment_vote(
@@ -1914,11 +2437,7 @@ class Database:
             cursor = await self.db.aql.execute(
                 query, bind_vars={"comment_id": comment_id, "user_id": user_id}
             )
-            existing_vote = None
-            async with cursor:
-                async for vote in cursor:
-                    existing_vote = vote
-                    break
+            existing_vote = _first(cursor)
 
             if existing_vote:
                 # Update existing vote
@@ -1928,11 +2447,12 @@ class Database:
                 else:
                     # Different vote, update it
                     await self.comment_likes_collection.update(
-                        existing_vote["_key"],
                         {
+                            "_key": existing_vote["_key"],
                             "vote_type": vote_type,
-                            "updated_at": datetime.now(timezone.utc).isoformat(),
+                            "updated_at": now_iso(),
                         },
+                        silent=True,
                     )
             else:
                 # Create new vote
@@ -1940,13 +2460,13 @@ class Database:
                     "comment_id": comment_id,
                     "user_id": user_id,
                     "vote_type": vote_type,
-                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "created_at": now_iso(),
                 }
-                await self.comment_likes_collection.insert(vote_data)
+                await self.comment_likes_collection.insert(vote_data, silent=True)
 
             return True
         except Exception as e:
-            logger.error(f"Error adding/updating comment vote: {e}")
+            logger.error("Error adding/updating comment vote: %s", e)
             return False
 
     async def get_comment_vote_stats(self, comment_id: str) -> Dict[str, int]:
@@ -1958,17 +2478,16 @@ class Database:
             COLLECT vote_type = vote.vote_type WITH COUNT INTO count
             RETURN {vote_type: vote_type, count: count}
             """
-            cursor = await self.db.aql.execute(query, bind_vars={"comment_id": comment_id})
+            cursor = await self._execute(query, bind_vars={"comment_id": comment_id})
             stats = {"likes": 0, "dislikes": 0}
-            async with cursor:
-                async for stat in cursor:
-                    if stat["vote_type"] == "like":
-                        stats["likes"] = stat["count"]
-                    elif stat["vote_type"] == "dislike":
-                        stats["dislikes"] = stat["count"]
+            for stat in await _collect(cursor):
+                if stat["vote_type"] == "like":
+                    stats["likes"] = stat["count"]
+                elif stat["vote_type"] == "dislike":
+                    stats["dislikes"] = stat["count"]
             return stats
         except Exception as e:
-            logger.error(f"Error fetching comment vote stats: {e}")
+            logger.error("Error fetching comment vote stats: %s", e)
             return {"likes": 0, "dislikes": 0}
 
     async def get_user_vote_for_comment(
@@ -1979,17 +2498,15 @@ class Database:
             query = """
             FOR vote IN comment_likes
             FILTER vote.comment_id == @comment_id AND vote.user_id == @user_id
+            LIMIT 1
             RETURN vote.vote_type
             """
-            cursor = await self.db.aql.execute(
+            cursor = await self._execute(
                 query, bind_vars={"comment_id": comment_id, "user_id": user_id}
             )
-            async with cursor:
-                async for vote_type in cursor:
-                    return vote_type
-            return None
+            return _first(cursor)
         except Exception as e:
-            logger.error(f"Error fetching user comment vote: {e}")
+            logger.error("Error fetching user comment vote: %s", e)
             return None
 
 
@@ -10,7 +10,7 @@ from starlette.staticfiles import StaticFiles
 from starlette.templating import Jinja2Templates
 
 from app.config import Config
-from app.database import db
+from app.database import close_clients, db
 from app.middleware.api_auth import APIAuthMiddleware
 from app.routes.admin import (
     admin_activity_logs,
@@ -42,6 +42,7 @@ from app.routes.api import (
     create_entry_comment,
     delete_entry,
     download_entry,
+    export_entries,
     get_comment_vote_stats,
     get_entry_comments,
     get_entry_info,
@@ -283,6 +284,7 @@ routes = [
     Route("/search", search_page),
     Route("/api-docs", api_docs_page),
     Route("/api/list", list_entries),
+    Route("/api/export", export_entries),
     Route("/api/download/{entry_id}", download_entry),
     Route("/api/reports/submit", submit_report, methods=["POST"]),
     Route("/api/entries/{entry_id}/hashes", compute_file_hashes, methods=["GET"]),
@@ -397,7 +399,7 @@ async def startup():
     # Only try to connect to database if initialized
     if Config.is_initialized():
         try:
-            await db.connect()
+            await db.ensure_connected()
             logger.info("→ Database connected successfully")
 
             # Start background hash computation service
@@ -550,6 +552,7 @@ async def shutdown():
     if Config.is_initialized():
         try:
             await db.disconnect()
+            await close_clients()
             logger.info("→ Database disconnected")
         except Exception as e:
             logger.error(f"→ Error disconnecting from database: {e}")
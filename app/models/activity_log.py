@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional
 
+from app.utils.time_utils import now_iso
+
 
 @dataclass
 class ActivityLog:
@@ -25,7 +26,7 @@ class ActivityLog:
             "username": self.username,
             "details": self.details or {},
             "ip_address": self.ip_address,
-            "timestamp": self.timestamp or datetime.utcnow().isoformat(),
+            "timestamp": self.timestamp or now_iso(),
         }
         if self._key:
             data["_key"] = self._key
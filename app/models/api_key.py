@@ -1,9 +1,10 @@
 import hashlib
 import secrets
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional
 
+from app.utils.time_utils import now_iso
+
 
 @dataclass
 class ApiKey:
@@ -40,7 +41,7 @@ class ApiKey:
             "user_id": self.user_id,
             "key_name": self.key_name,
             "key_hash": self.key_hash,
-            "created_at": self.created_at or datetime.utcnow().isoformat(),
+            "created_at": self.created_at or now_iso(),
             "last_used_at": self.last_used_at,
             "is_active": self.is_active,
         }
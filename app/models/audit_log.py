@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional
 
+from app.utils.time_utils import now_iso
+
 
 @dataclass
 class AuditLog:
@@ -27,7 +28,7 @@ class AuditLog:
             "target_username": self.target_username,
             "details": self.details or {},
             "ip_address": self.ip_address,
-            "timestamp": self.timestamp or datetime.utcnow().isoformat(),
+            "timestamp": self.timestamp or now_iso(),
         }
         if self._key:
             data["_key"] = self._key
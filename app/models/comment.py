@@ -1,6 +1,7 @@
-from datetime import datetime
 from typing import Any, Dict, Optional
 
+from app.utils.time_utils import now_iso
+
 
 class Comment:
     """Comment model representing a user comment on an entry"""
@@ -20,7 +21,7 @@ class Comment:
         self.username = username
         self.text = text
         self.parent_comment_id = parent_comment_id
-        self.created_at = created_at or datetime.utcnow().isoformat()
+        self.created_at = created_at or now_iso()
         self.updated_at = updated_at
 
     def to_dict(self) -> Dict[str, Any]:
@@ -1,7 +1,8 @@
-from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 
+from app.utils.time_utils import now_iso
+
 
 class EntryType(str, Enum):
     """Entry type enum"""
@@ -44,7 +45,7 @@ class Entry:
         self.size = size
         self.created_by = created_by
         self.metadata = metadata or {}
-        self.created_at = created_at or datetime.utcnow().isoformat()
+        self.created_at = created_at or now_iso()
         self.file_created_at = file_created_at
         self.file_modified_at = file_modified_at
         self.corrupt = corrupt
@@ -1,7 +1,8 @@
-from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 
+from app.utils.time_utils import now_iso
+
 
 class VoteType(str, Enum):
     """Vote type enum"""
@@ -24,7 +25,7 @@ class Like:
         self.entry_id = entry_id
         self.user_id = user_id
         self.vote_type = vote_type
-        self.created_at = created_at or datetime.utcnow().isoformat()
+        self.created_at = created_at or now_iso()
         self.updated_at = updated_at
 
     def to_dict(self) -> Dict[str, Any]:
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from app.utils.time_utils import now_iso
+
 
 class RequestStatus(str, Enum):
     """Request status enum"""
@@ -48,7 +49,7 @@ class Request:
             "status": self.status.value
             if isinstance(self.status, RequestStatus)
             else self.status,
-            "created_at": self.created_at or datetime.utcnow().isoformat(),
+            "created_at": self.created_at or now_iso(),
             "reviewed_by": self.reviewed_by,
             "reviewed_at": self.reviewed_at,
             "game_name": self.game_name,
@@ -1,8 +1,9 @@
 import hashlib
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional
 
+from app.utils.time_utils import now_iso
+
 try:
     from argon2 import PasswordHasher
     from argon2.exceptions import (
@@ -85,7 +86,7 @@ class User:
             "is_admin": self.is_admin,
             "is_moderator": self.is_moderator,
             "is_uploader": self.is_uploader,
-            "created_at": self.created_at or datetime.utcnow().isoformat(),
+            "created_at": self.created_at or now_iso(),
             "totp_secret": self.totp_secret,
             "totp_enabled": self.totp_enabled,
         }
@@ -7,7 +7,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, RedirectResponse, Response
 from starlette.templating import Jinja2Templates
 
-from app.config import Config
+from app.config import CONFIG, Config
 from app.database import db
 from app.models.entry import FileType
 from app.models.user import User
@@ -243,7 +243,7 @@ async def admin_init_submit(request: Request) -> Response:
             base_time = datetime.now(timezone.utc)
             for i, game in enumerate(SAMPLE_GAMES):
                 game["created_at"] = (base_time - timedelta(hours=i * 2)).isoformat()
-                await db.add_entry(game)
+            await db.import_entries(SAMPLE_GAMES)
 
             logger.info(f"Created {len(SAMPLE_GAMES)} sample entries")
 
@@ -280,7 +280,7 @@ async def admin_dashboard(request: Request) -> Response:
             {
                 "title": "Access Denied",
                 "error_message": "You do not have permission to access the admin dashboard.",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -290,7 +290,7 @@ async def admin_dashboard(request: Request) -> Response:
         "admin/dashboard.html",
         {
             "title": "Admin Dashboard",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "db_host": Config.get("database.host", "127.0.0.1"),
             "db_name": Config.get("database.database", "switch_db"),
         },
@@ -313,7 +313,7 @@ async def admin_directories(request: Request) -> Response:
             {
                 "title": "Access Denied",
                 "error_message": "You do not have permission to access the admin dashboard.",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -342,7 +342,7 @@ async def admin_directories(request: Request) -> Response:
         "admin/directories.html",
         {
             "title": "Directory Management",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "directories": directories,
         },
     )
@@ -611,6 +611,14 @@ async def scan_directory_for_files(
         except Exception as e:
             logger.error(f"Error scanning {path}: {e}")
 
+    # New entries are buffered and written with bulk inserts
+    pending = []
+
+    async def flush_pending() -> int:
+        count = await db.import_entries(pending)
+        pending.clear()
+        return count
+
     # Scan directory
     for file_path in walk_directory(directory_path):
         try:
@@ -641,7 +649,6 @@ async def scan_directory_for_files(
                 "file_type": get_file_type(file_path),
                 "size": file_size,
                 "created_by": username,
-                "created_at": datetime.utcnow().isoformat(),
                 "file_created_at": file_created,
                 "file_modified_at": file_modified,
                 "metadata": {
@@ -651,13 +658,16 @@ async def scan_directory_for_files(
                 },
             }
 
-            result = await db.add_entry(entry_data)
-            if result:
-                added_count += 1
+            pending.append(entry_data)
+            if len(pending) >= 500:
+                added_count += await flush_pending()
 
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {e}")
 
+    if pending:
+        added_count += await flush_pending()
+
     return added_count, skipped_count
 
 
@@ -677,13 +687,13 @@ async def admin_users(request: Request) -> Response:
             {
                 "title": "Access Denied",
                 "error_message": "You do not have permission to access the admin dashboard.",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
 
-    # Get all users
-    users = await db.get_all_users()
+    # Get all users, without credentials since they are passed to the template
+    users = await db.get_all_users(include_secrets=False)
 
     # Get statistics for each user
     for user in users:
@@ -692,15 +702,12 @@ async def admin_users(request: Request) -> Response:
             user_stats = await db.get_user_statistics(user_id)
             user["statistics"] = user_stats
 
-        # Don't show password hashes in the template
-        user.pop("password_hash", None)
-
     return templates.TemplateResponse(
         request,
         "admin/users.html",
         {
             "title": "User Management",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "users": users,
         },
     )
@@ -902,7 +909,7 @@ async def admin_api_keys(request: Request) -> Response:
             {
                 "title": "Unauthorized",
                 "error": "You must be an administrator to access this page",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -911,8 +918,12 @@ async def admin_api_keys(request: Request) -> Response:
     all_api_keys = await db.get_all_api_keys()
 
     # Enhance API keys with user information
+    users = await db.get_users_by_ids(
+        [key["user_id"] for key in all_api_keys if key.get("user_id")]
+    )
+    users_by_id = {user["_key"]: user for user in users}
     for key in all_api_keys:
-        user = await db.get_user_by_id(key.get("user_id", ""))
+        user = users_by_id.get(key.get("user_id", ""))
         if user:
             key["username"] = user.get("username", "Unknown")
         else:
@@ -923,7 +934,7 @@ async def admin_api_keys(request: Request) -> Response:
         "admin/api_keys.html",
         {
             "title": "API Key Management",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "api_keys": all_api_keys,
         },
     )
@@ -981,7 +992,7 @@ async def admin_user_api_usage(request: Request) -> Response:
             {
                 "title": "Unauthorized",
                 "error": "You must be an administrator to access this page",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -999,7 +1010,7 @@ async def admin_user_api_usage(request: Request) -> Response:
                 {
                     "title": "User Not Found",
                     "error": "The specified user was not found",
-                    "app_name": Config.get("app.name", "Switch Game Repository"),
+                    "app_name": CONFIG.app_name,
                 },
                 status_code=404,
             )
@@ -1012,7 +1023,7 @@ async def admin_user_api_usage(request: Request) -> Response:
             "admin/user_api_usage.html",
             {
                 "title": f"API Usage - {user.get('username')}",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
                 "user": user,
                 "usage_stats": usage_stats,
                 "recent_usage": recent_usage,
@@ -1020,7 +1031,7 @@ async def admin_user_api_usage(request: Request) -> Response:
         )
     else:
         # Get all users with their usage stats
-        all_users = await db.get_all_users()
+        all_users = await db.get_all_users(include_secrets=False)
         user_usage_list = []
 
         for user in all_users:
@@ -1040,7 +1051,7 @@ async def admin_user_api_usage(request: Request) -> Response:
             "admin/api_usage_overview.html",
             {
                 "title": "API Usage Overview",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
                 "user_usage_list": user_usage_list,
             },
         )
@@ -1059,7 +1070,7 @@ async def admin_audit_logs(request: Request) -> Response:
             {
                 "title": "Unauthorized",
                 "error": "You must be an administrator to access this page",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -1092,7 +1103,7 @@ async def admin_audit_logs(request: Request) -> Response:
         "admin/audit_logs.html",
         {
             "title": "Audit Logs",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "logs": logs,
             "stats": stats,
             "unique_actions": unique_actions,
@@ -1115,7 +1126,7 @@ async def admin_activity_logs(request: Request) -> Response:
             {
                 "title": "Unauthorized",
                 "error": "You must be an administrator to access this page",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -1150,7 +1161,7 @@ async def admin_activity_logs(request: Request) -> Response:
         "admin/activity_logs.html",
         {
             "title": "Activity Logs",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "logs": logs,
             "stats": stats,
             "unique_event_types": unique_event_types,
@@ -1173,7 +1184,7 @@ async def admin_storage_info(request: Request) -> Response:
             {
                 "title": "Unauthorized",
                 "error": "You must be an administrator to access this page",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -1257,15 +1268,14 @@ async def admin_storage_info(request: Request) -> Response:
             )
 
     # Get total game count from database (including URLs)
-    all_entries = await db.get_all_entries()
-    total_entries = len(all_entries)
+    total_entries = await db.count_entries()
 
     return templates.TemplateResponse(
         request,
         "admin/storage_info.html",
         {
             "title": "Storage Information",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "storage_data": storage_data,
             "total_games": total_games,
             "total_entries": total_entries,
@@ -1287,7 +1297,7 @@ async def admin_upload_statistics(request: Request) -> Response:
             {
                 "title": "Access Denied",
                 "error_message": "You do not have permission to access this page.",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -1303,7 +1313,7 @@ async def admin_upload_statistics(request: Request) -> Response:
         "admin/upload_statistics.html",
         {
             "title": "Upload Statistics",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "uploader_stats": uploader_stats,
             "overall_stats": overall_stats,
         },
@@ -1330,7 +1340,7 @@ async def admin_reports(request: Request) -> Response:
             {
                 "title": "Access Denied",
                 "error_message": "You do not have permission to access this page.",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -1350,7 +1360,7 @@ async def admin_reports(request: Request) -> Response:
         "admin/reports.html",
         {
             "title": "File Reports",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "reports": reports,
             "current_status": status,
             "open_count": open_count,
@@ -1461,8 +1471,9 @@ async def admin_migrate_passwords(request: Request) -> Response:
             if User.needs_rehash(password_hash):
                 # We can't migrate without the plain password, so we skip
                 # Migration will happen automatically when users log in
-                logger.info(
-                    f"User {user.username} password marked for migration on next login"
+                logger.debug(
+                    "User %s password marked for migration on next login",
+                    user.username,
                 )
                 failed_count += 1
             else:
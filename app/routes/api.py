@@ -1,19 +1,39 @@
 import asyncio
 import hashlib
+import json
 import logging
 import os
 
 from starlette.background import BackgroundTask
 from starlette.requests import Request
-from starlette.responses import FileResponse, JSONResponse, RedirectResponse
+from starlette.responses import (
+    FileResponse,
+    JSONResponse,
+    RedirectResponse,
+    StreamingResponse,
+)
 
 from app.config import Config
 from app.database import db
 from app.utils.ip_utils import format_ip_for_log, get_ip_info
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _ndjson_line(data) -> bytes:
+    """Serialize one record as a compact JSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data) + b"\n"
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode()
+
+
 async def list_entries(request: Request):
     """API endpoint to list all entries"""
     # Require authentication - either session or API key
@@ -45,6 +65,41 @@ async def list_entries(request: Request):
         return JSONResponse({"error": str(e)}, status_code=500)
 
 
+async def export_entries(request: Request):
+    """API endpoint to stream all entries as newline-delimited JSON"""
+    # Require authentication - either session or API key
+    has_session = request.session.get("user_id") is not None
+    has_api_auth = getattr(request.state, "authenticated", False)
+
+    if not has_session and not has_api_auth:
+        return JSONResponse(
+            {"error": "Authentication required. Please log in or use an API key."},
+            status_code=401,
+        )
+
+    # Optional paging: ?offset=N&limit=M
+    try:
+        offset = max(int(request.query_params.get("offset", 0)), 0)
+        limit = request.query_params.get("limit")
+        limit = max(int(limit), 0) if limit is not None else None
+    except ValueError:
+        return JSONResponse(
+            {"error": "offset and limit must be integers"}, status_code=400
+        )
+
+    async def ndjson_lines():
+        try:
+            async for entry in db.iter_entries(offset=offset, limit=limit):
+                yield _ndjson_line(entry)
+        except Exception as e:
+            # Headers are already sent, so end the stream with an error record
+            # clients can detect instead of cutting it off mid-line
+            logger.error(f"Error exporting entries: {e}")
+            yield _ndjson_line({"error": "Export failed"})
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 async def download_entry(request: Request):
     """API endpoint to download an entry"""
     # Require authentication - either session or API key
@@ -843,14 +898,7 @@ async def vote_comment(request: Request):
             )
 
         # Verify comment exists
-        query = "FOR comment IN comments FILTER comment._key == @comment_id RETURN comment"
-        cursor = await db.db.aql.execute(query, bind_vars={"comment_id": comment_id})
-        comment = None
-        async with cursor:
-            async for c in cursor:
-                comment = c
-                break
-
+        comment = await db.get_comment_by_id(comment_id)
         if not comment:
             return JSONResponse(
                 {"success": False, "error": "Comment not found"},
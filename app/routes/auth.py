@@ -4,7 +4,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, RedirectResponse, Response
 from starlette.templating import Jinja2Templates
 
-from app.config import Config
+from app.config import CONFIG
 from app.database import db
 from app.models.user import User
 from app.utils.ip_utils import format_ip_for_log, get_ip_info
@@ -25,7 +25,7 @@ async def login_page(request: Request) -> Response:
         "auth/login.html",
         {
             "title": "Login",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
         },
     )
 
@@ -135,7 +135,7 @@ async def register_page(request: Request) -> Response:
         "auth/register.html",
         {
             "title": "Register",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
         },
     )
 
@@ -2,7 +2,7 @@ from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
 from starlette.templating import Jinja2Templates
 
-from app.config import Config
+from app.config import CONFIG, Config
 from app.database import db
 
 # We'll import templates from main.py after we update it
@@ -39,7 +39,7 @@ async def index(request: Request) -> Response:
         "index.html",
         {
             "title": "Home",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "is_moderator": is_moderator,
             "pending_count": pending_count,
             "system_stats": system_stats,
@@ -71,7 +71,7 @@ async def search_page(request: Request) -> Response:
         "search.html",
         {
             "title": "Search Games",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "is_moderator": is_moderator,
         },
     )
@@ -88,6 +88,6 @@ async def api_docs_page(request: Request) -> Response:
         "api_docs.html",
         {
             "title": "API Documentation",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
         },
     )
@@ -11,7 +11,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, RedirectResponse, Response
 from starlette.templating import Jinja2Templates
 
-from app.config import Config
+from app.config import CONFIG, Config
 from app.database import db
 from app.models.entry import Entry, EntryType, FileType
 from app.utils.ip_utils import format_ip_for_log, get_ip_info
@@ -60,7 +60,7 @@ async def uploader_dashboard(request: Request) -> Response:
             {
                 "title": "Access Denied",
                 "error_message": "You do not have permission to access the uploader dashboard.",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -80,7 +80,7 @@ async def uploader_dashboard(request: Request) -> Response:
         "uploader/dashboard.html",
         {
             "title": "Uploader Dashboard",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "pending_game_requests": len(game_requests),
             "upload_stats": upload_stats,
             "is_admin": is_admin,
@@ -110,7 +110,7 @@ async def uploader_game_requests(request: Request) -> Response:
             {
                 "title": "Access Denied",
                 "error_message": "You do not have permission to access this page.",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -132,7 +132,7 @@ async def uploader_game_requests(request: Request) -> Response:
         "uploader/game_requests.html",
         {
             "title": "Game Requests",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "requests": game_requests,
             "status_filter": status_filter,
             "is_admin": is_admin,
@@ -278,7 +278,7 @@ async def uploader_upload_page(request: Request) -> Response:
             {
                 "title": "Access Denied",
                 "error_message": "You do not have permission to upload games.",
-                "app_name": Config.get("app.name", "Switch Game Repository"),
+                "app_name": CONFIG.app_name,
             },
             status_code=403,
         )
@@ -288,7 +288,7 @@ async def uploader_upload_page(request: Request) -> Response:
         "uploader/upload.html",
         {
             "title": "Upload Game",
-            "app_name": Config.get("app.name", "Switch Game Repository"),
+            "app_name": CONFIG.app_name,
             "is_admin": is_admin,
             "is_moderator": is_mod,
             "upload_endpoint": Config.UPLOAD_ENDPOINT(),
@@ -448,23 +448,7 @@ async def uploader_upload_submit(request: Request) -> Response:
         logger.info(f"File saved to {file_path}, size: {size} bytes")
 
         # Check for duplicate filename in database
-        duplicate_by_name = await db.db.aql.execute(
-            """
-            FOR doc IN entries
-            FILTER doc.name == @name
-            LIMIT 1
-            RETURN doc
-        """,
-            bind_vars={"name": name},
-        )
-
-        has_duplicate_name = False
-        async with duplicate_by_name:
-            async for _ in duplicate_by_name:
-                has_duplicate_name = True
-                break
-
-        if has_duplicate_name:
+        if await db.entry_name_exists(name):
             # Delete the uploaded file
             try:
                 os.remove(file_path)
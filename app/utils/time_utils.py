@@ -0,0 +1,10 @@
+"""
+Utility functions for timestamps stored in the database.
+"""
+
+from datetime import datetime, timezone
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO-8601 string with a fixed microsecond width"""
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")